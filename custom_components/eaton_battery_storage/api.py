@@ -22,11 +22,23 @@ from typing import Any
 import aiohttp
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.storage import Store
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def is_successful(result: dict[str, Any]) -> bool:
+    """Return whether an API response reports success.
+
+    Responses without a successful flag count as successful if they carry a
+    result.
+    """
+    if "successful" in result:
+        return bool(result["successful"])
+    return result.get("result") is not None
+
+
 class EatonBatteryAPI:
     """API client for Eaton xStorage Home battery system."""
 
@@ -312,8 +324,13 @@ class EatonBatteryAPI:
 
     async def update_settings(self, settings_data: dict[str, Any]) -> dict[str, Any]:
         """Update device settings via PUT /api/settings."""
-        _LOGGER.debug(
-            "Sending settings update: %s",
-            json.dumps(settings_data, separators=(",", ":")),
+        # Serialize once with orjson; the same body is logged and sent
+        body = json_bytes(settings_data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sending settings update: %s", body.decode())
+        return await self.make_request(
+            "PUT",
+            "/api/settings",
+            data=body,
+            headers={"Content-Type": "application/json"},
         )
-        return await self.make_request("PUT", "/api/settings", json=settings_data)
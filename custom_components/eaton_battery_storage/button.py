@@ -10,6 +10,8 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api import is_successful
+
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
@@ -96,7 +98,7 @@ class EatonXStorageStopCurrentOperationButton(CoordinatorEntity, ButtonEntity):
                 "SET_BASIC_MODE", 1, {}
             )
 
-            if result.get("successful", result.get("result") is not None):
+            if is_successful(result):
                 _LOGGER.info(
                     "Successfully stopped current operation - set to basic mode"
                 )
@@ -10,20 +10,78 @@ today, and last30daysEnergyFlow sections.
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
 from datetime import timedelta
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import EatonBatteryAPI
+from .api import EatonBatteryAPI, is_successful
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _deep_update(target: dict[str, Any], updates: dict[str, Any]) -> None:
+    """Recursively merge updates into target in place."""
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _deep_update(target[key], value)
+        else:
+            target[key] = value
+
+
+def _merged_copy(base: dict[str, Any], updates: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of base with updates merged in recursively.
+
+    Only dicts along the update paths are copied, other values are shared.
+    """
+    merged = dict(base)
+    for key, value in updates.items():
+        current = merged.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            merged[key] = _merged_copy(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+# Settings fields returned as objects and the key holding the id the PUT expects
+GEO_FIELD_IDS: tuple[tuple[str, str], ...] = (
+    ("country", "geonameId"),
+    ("city", "geonameId"),
+    ("timezone", "id"),
+)
+
+
+def flatten_geo_fields(settings: dict[str, Any]) -> None:
+    """Flatten location fields of a settings document in place.
+
+    The GET API returns objects, but PUT API expects strings/primitives.
+    """
+    for field, id_key in GEO_FIELD_IDS:
+        value = settings.get(field)
+        # Decoded JSON, so an exact type check suffices
+        if type(value) is dict:
+            settings[field] = value.get(id_key, "")
+
+
+# Keys of the settings document a cached copy must have to be PUT back
+SETTINGS_DOCUMENT_KEYS: tuple[str, ...] = ("defaultMode", "energySavingMode")
+
+
+def _is_settings_document(value: Any) -> bool:
+    """Return whether value looks like a settings document from the API."""
+    return isinstance(value, dict) and any(
+        key in value for key in SETTINGS_DOCUMENT_KEYS
+    )
+
+
 class EatonXstorageHomeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching data from the Eaton xStorage Home API."""
 
@@ -38,6 +96,15 @@ class EatonXstorageHomeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         self.api = api
         self.config_entry = config_entry
+        # Locally stored number values used as operation mode parameters,
+        # loaded by the number platform
+        self.number_values: dict[str, int] = {}
+        self.number_store: Store[dict[str, int]] = Store(
+            hass, 1, f"{DOMAIN}_number_values.json"
+        )
+        self.number_entities_by_key: dict[str, Any] = {}
+        # In-flight settings request shared by concurrent settings writes
+        self._settings_task: asyncio.Task[dict[str, Any]] | None = None
 
     @property
     def battery_level(self) -> int | None:
@@ -91,6 +158,89 @@ class EatonXstorageHomeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return device_info
 
+    async def async_build_settings_payload(
+        self, overrides: dict[str, Any], *, replace: bool = False
+    ) -> dict[str, Any] | None:
+        """Build a PUT /api/settings payload with the given overrides applied.
+
+        Uses the settings cached by the last refresh and only fetches them from
+        the API when the cache is missing, is not a settings document or the
+        last refresh failed. Overrides are merged recursively unless replace is
+        set, in which case top-level keys are replaced as a whole. Returns None
+        if no settings are available.
+        """
+        cached = None
+        if self.data and self.last_update_success:
+            cached = self.data.get("settings")
+        if not _is_settings_document(cached):
+            response = await self._async_fetch_settings()
+            cached = response.get("result") if response else None
+            if not cached:
+                return None
+
+        # Shallow copy; flattening only replaces top-level values and the
+        # merge copies nested dicts on the override paths, so the cache is
+        # never mutated
+        settings = dict(cached)
+        flatten_geo_fields(settings)
+        if replace:
+            settings.update(overrides)
+        else:
+            settings = _merged_copy(settings, overrides)
+
+        # API expects data wrapped in "settings" object
+        return {"settings": settings}
+
+    async def async_update_settings(
+        self, overrides: dict[str, Any], *, replace: bool = False
+    ) -> dict[str, Any] | None:
+        """Apply overrides to the device settings with a single PUT.
+
+        Builds the payload from the cached settings, sends it and, if the
+        device accepts it, writes the change through to the cache. Returns the
+        API response, or None if no settings were available to build on.
+        """
+        payload = await self.async_build_settings_payload(overrides, replace=replace)
+        if payload is None:
+            return None
+        return await self.async_put_settings(payload, overrides, replace=replace)
+
+    async def async_put_settings(
+        self,
+        payload: dict[str, Any],
+        overrides: dict[str, Any],
+        *,
+        replace: bool = False,
+    ) -> dict[str, Any]:
+        """Send a payload built by async_build_settings_payload to the device.
+
+        Writes the overrides through to the cache if the device accepts them.
+        """
+        result = await self.api.update_settings(payload)
+        if is_successful(result):
+            self.update_cached_settings(overrides, replace=replace)
+        return result
+
+    async def _async_fetch_settings(self) -> dict[str, Any]:
+        """Fetch settings from the API, sharing one request between callers."""
+        if self._settings_task is None or self._settings_task.done():
+            self._settings_task = self.hass.async_create_task(self.api.get_settings())
+        # Shield so a cancelled caller does not cancel the shared request
+        return await asyncio.shield(self._settings_task)
+
+    def update_cached_settings(
+        self, overrides: dict[str, Any], *, replace: bool = False
+    ) -> None:
+        """Merge settings accepted by the device into the cached settings.
+
+        Keeps payloads built before the next refresh from reverting the change.
+        """
+        if self.data and isinstance(self.data.get("settings"), dict):
+            if replace:
+                self.data["settings"].update(copy.deepcopy(overrides))
+            else:
+                _deep_update(self.data["settings"], copy.deepcopy(overrides))
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API endpoint."""
         try:
@@ -138,6 +288,14 @@ class EatonXstorageHomeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             ]:
                 try:
                     data = await method()
+                    if isinstance(data, dict) and data.get("successful") is False:
+                        # Error responses have no result; never cache them as
+                        # data, settings writes would PUT them back
+                        _LOGGER.debug(
+                            "Failed to fetch %s: %s", endpoint, data.get("error")
+                        )
+                        results[endpoint] = {}
+                        continue
                     results[endpoint] = (
                         data.get("result", {})
                         if data and isinstance(data, dict) and "result" in data
@@ -11,23 +11,27 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
-from homeassistant.components.number import NumberEntity
+from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.dispatcher import (
-    async_dispatcher_connect,
-    async_dispatcher_send,
-)
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .number_constants import NUMBER_ENTITIES
+from .api import is_successful
+from .number_constants import (
+    CHARGE_POWER,
+    CHARGE_POWER_WATT,
+    DISCHARGE_POWER,
+    DISCHARGE_POWER_WATT,
+    NUMBER_DEFAULTS,
+    NUMBER_ENTITIES,
+    NumberEntityDefinition,
+)
 
 if TYPE_CHECKING:
     from .coordinator import EatonBatteryStorageCoordinator
@@ -38,6 +42,36 @@ PARALLEL_UPDATES = 0
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds to wait before persisting number values after a change
+NUMBER_SAVE_DELAY = 2.0
+
+# 100% charge/discharge power corresponds to 3600W, so 1% is 36W
+WATTS_PER_PERCENT = 36
+
+# Seconds a written setting is shown before the device must report it; the
+# device endpoint can lag the settings by a poll or two
+WRITE_CONFIRM_TIMEOUT = 180.0
+
+
+def _percent_to_watt(value: float) -> int:
+    """Convert a power percentage to watts."""
+    return int(value) * WATTS_PER_PERCENT
+
+
+def _watt_to_percent(value: float) -> int:
+    """Convert a power in watts to a percentage, rounded to the nearest."""
+    return (int(value) + WATTS_PER_PERCENT // 2) // WATTS_PER_PERCENT
+
+
+# Maps each linked entity key to its counterpart key, conversion and the
+# state attribute name used to expose the converted value
+LINKED_VALUES: dict[str, tuple[str, Callable[[float], int], str]] = {
+    CHARGE_POWER: (CHARGE_POWER_WATT, _percent_to_watt, "wattage"),
+    CHARGE_POWER_WATT: (CHARGE_POWER, _watt_to_percent, "percent"),
+    DISCHARGE_POWER: (DISCHARGE_POWER_WATT, _percent_to_watt, "wattage"),
+    DISCHARGE_POWER_WATT: (DISCHARGE_POWER, _watt_to_percent, "percent"),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -47,48 +81,36 @@ async def async_setup_entry(
     """Set up Eaton Battery Storage number platform."""
     coordinator = entry.runtime_data
 
-    # Setup storage for local number values (for percentage/watt conversions)
-    store = Store(hass, 1, f"{DOMAIN}_number_values.json")
+    # Load local number values (for percentage/watt conversions) into the
+    # coordinator so entities and the current mode select share them
+    store = coordinator.number_store
     stored = await store.async_load() or {}
-
-    # Store data directly on the coordinator for access by entities
-    if not hasattr(coordinator, "number_values"):
-        coordinator.number_values = stored
-        # Set defaults for missing values
-        for desc in NUMBER_ENTITIES:
-            key = desc["key"]
-            if key not in coordinator.number_values:
-                default = desc.get("default")
-                if default is not None:
-                    coordinator.number_values[key] = default
-        # Set linked watt values if percent defaults are set
-        if "charge_power" in coordinator.number_values:
-            coordinator.number_values["charge_power_watt"] = int(
-                round((coordinator.number_values["charge_power"] / 100) * 3600)
-            )
-        if "discharge_power" in coordinator.number_values:
-            coordinator.number_values["discharge_power_watt"] = int(
-                round((coordinator.number_values["discharge_power"] / 100) * 3600)
-            )
-        # Save defaults if storage was empty
-        if not stored:
-            await store.async_save(coordinator.number_values)
-    if not hasattr(coordinator, "number_store"):
-        coordinator.number_store = store
-
-    entities: list[NumberEntity] = []
-
-    # Add configurable number entities from constants
-    entities.extend(
-        EatonBatteryNumberEntity(coordinator, desc) for desc in NUMBER_ENTITIES
-    )
+    values = coordinator.number_values
+    # Seed defaults for missing values in one pass; all entities have a step
+    # of 1, so values are kept as integers
+    values.update(NUMBER_DEFAULTS)
+    values.update({key: int(value) for key, value in stored.items()})
+    # Set linked watt values from the authoritative percent values
+    for key in (CHARGE_POWER, DISCHARGE_POWER):
+        if key in values:
+            linked_key, convert, _ = LINKED_VALUES[key]
+            values[linked_key] = convert(values[key])
+    # Save if any defaults or linked values were added
+    if values.keys() != stored.keys():
+        store.async_delay_save(lambda: values, NUMBER_SAVE_DELAY)
+
+    # Add configurable number entities from constants, keyed so an entity can
+    # refresh its linked counterpart directly
+    coordinator.number_entities_by_key = {
+        desc.key: EatonBatteryNumberEntity(coordinator, desc)
+        for desc in NUMBER_ENTITIES
+    }
+    entities: list[NumberEntity] = [*coordinator.number_entities_by_key.values()]
 
     # Add API-controlled settings entities
-    entities.extend(
-        [
-            EatonXStorageHouseConsumptionThresholdNumber(coordinator),
-            EatonXStorageBatteryBackupLevelNumber(coordinator),
-        ]
+    entities += (
+        EatonXStorageHouseConsumptionThresholdNumber(coordinator),
+        EatonXStorageBatteryBackupLevelNumber(coordinator),
     )
 
     _LOGGER.debug("Adding %d number entities", len(entities))
@@ -98,381 +120,279 @@ async def async_setup_entry(
 class EatonBatteryNumberEntity(CoordinatorEntity, NumberEntity):
     """Number entity for Eaton Battery Storage configurable values."""
 
-    _attr_mode = "box"
+    # Only our own attributes; _attr_* fields are managed by the entity base
+    __slots__ = (
+        "_key",
+        "_values",
+        "_linked_key",
+        "_convert_fn",
+        "_linked_attr",
+        "_peer_write",
+    )
+
+    _attr_mode = NumberMode.BOX
     _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: EatonBatteryStorageCoordinator,
-        description: dict[str, str | int | float],
+        description: NumberEntityDefinition,
     ) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
-        self._key = description["key"]
-        self._attr_unique_id = f"eaton_battery_{description['key']}"
-        self._attr_name = description["name"]
-        self._attr_native_min_value = float(description["min"])
-        self._attr_native_max_value = float(description["max"])
-        self._attr_native_step = float(description["step"])
-        self._attr_native_unit_of_measurement = description["unit"]
-        self._attr_device_class = description["device_class"]
-
-    async def async_added_to_hass(self) -> None:
-        """Register for dispatcher updates."""
-        await super().async_added_to_hass()
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass, f"{DOMAIN}_number_update", self._handle_external_update
-            )
-        )
-
-    def _handle_external_update(self) -> None:
-        """Handle external updates via dispatcher."""
-        self.schedule_update_ha_state()
+        self._key = description.key
+        self._attr_device_info = coordinator.device_info
+        self._attr_unique_id = description.unique_id
+        self._attr_name = description.name
+        self._attr_native_min_value = description.min
+        self._attr_native_max_value = description.max
+        self._attr_native_step = description.step
+        self._attr_native_unit_of_measurement = description.unit
+        self._attr_device_class = description.device_class
+        # Shared with the coordinator so linked writes are visible here
+        self._values: dict[str, int] = coordinator.number_values
+        # Resolve the linked counterpart once, the key never changes
+        self._linked_key: str | None = None
+        self._convert_fn: Callable[[float], int] | None = None
+        self._linked_attr: str | None = None
+        if (linked := LINKED_VALUES.get(self._key)) is not None:
+            self._linked_key, self._convert_fn, self._linked_attr = linked
+        # Pending state write for the linked entity, if any
+        self._peer_write: asyncio.Handle | None = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending linked entity state write."""
+        await super().async_will_remove_from_hass()
+        if self._peer_write is not None:
+            self._peer_write.cancel()
+            self._peer_write = None
 
     @property
     def extra_state_attributes(self) -> dict[str, int] | None:
         """Return extra state attributes showing linked values."""
+        if self._convert_fn is None:
+            return None
         native_val = self.native_value
         if native_val is None:
             return None
-
-        if self._key == "charge_power":
-            watts = int(round((native_val / 100) * 3600))
-            return {"wattage": watts}
-        if self._key == "charge_power_watt":
-            percent = int(round((native_val / 3600) * 100))
-            return {"percent": percent}
-        if self._key == "discharge_power":
-            watts = int(round((native_val / 100) * 3600))
-            return {"wattage": watts}
-        if self._key == "discharge_power_watt":
-            percent = int(round((native_val / 3600) * 100))
-            return {"percent": percent}
-        return None
+        return {self._linked_attr: self._convert_fn(native_val)}
 
     @property
-    def native_value(self) -> float | None:
+    def native_value(self) -> int | None:
         """Return the current value from storage."""
-        return getattr(self.coordinator, "number_values", {}).get(self._key)
+        return self._values.get(self._key)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the number value and update linked entities."""
-        # Ensure number_values exists on coordinator
-        if not hasattr(self.coordinator, "number_values"):
-            self.coordinator.number_values = {}
-        if not hasattr(self.coordinator, "number_store"):
-            store = Store(self.hass, 1, f"{DOMAIN}_number_values.json")
-            self.coordinator.number_store = store
+        value = int(value)
+        if self._values.get(self._key) == value:
+            return
 
         # Store the value
-        self.coordinator.number_values[self._key] = value
+        self._values[self._key] = value
 
         # Calculate and store linked values
         linked_key = self._calculate_linked_value(value)
 
-        # Save to persistent storage
-        await self.coordinator.number_store.async_save(self.coordinator.number_values)
+        # Save to persistent storage, coalescing rapid changes into one write
+        self.coordinator.number_store.async_delay_save(
+            lambda: self.coordinator.number_values, NUMBER_SAVE_DELAY
+        )
 
         # Update this entity
         self.async_write_ha_state()
 
-        # Notify other entities via dispatcher
-        if linked_key:
-            async_dispatcher_send(self.hass, f"{DOMAIN}_number_update")
+        # Update the linked entity, coalescing rapid sets into one write
+        if linked_key and self._peer_write is None:
+            self._peer_write = self.hass.loop.call_soon(self._write_peer_state)
 
-    def _calculate_linked_value(self, value: float) -> str | None:
-        """Calculate and store linked value, return linked key if any."""
-        if self._key == "charge_power":
-            watts = int(round((value / 100) * 3600))
-            self.coordinator.number_values["charge_power_watt"] = watts
-            return "charge_power_watt"
-        if self._key == "charge_power_watt":
-            percent = int(round((value / 3600) * 100))
-            self.coordinator.number_values["charge_power"] = percent
-            return "charge_power"
-        if self._key == "discharge_power":
-            watts = int(round((value / 100) * 3600))
-            self.coordinator.number_values["discharge_power_watt"] = watts
-            return "discharge_power_watt"
-        if self._key == "discharge_power_watt":
-            percent = int(round((value / 3600) * 100))
-            self.coordinator.number_values["discharge_power"] = percent
-            return "discharge_power"
-        return None
+    @callback
+    def _write_peer_state(self) -> None:
+        """Write the state of the linked entity."""
+        self._peer_write = None
+        peer = self.coordinator.number_entities_by_key.get(self._linked_key)
+        if peer is not None and peer.hass is not None:
+            peer.async_write_ha_state()
 
-    @property
-    def device_info(self) -> dict[str, str]:
-        """Return device information."""
-        return self.coordinator.device_info
+    def _calculate_linked_value(self, value: int) -> str | None:
+        """Calculate and store linked value, return linked key if any."""
+        if self._convert_fn is not None:
+            self._values[self._linked_key] = self._convert_fn(value)
+        return self._linked_key
 
 
-class EatonXStorageHouseConsumptionThresholdNumber(CoordinatorEntity, NumberEntity):
-    """Number entity to control the House Consumption Threshold.
+class _EatonSettingsNumberBase(CoordinatorEntity, NumberEntity):
+    """Base class for number entities backed by the device settings API."""
 
-    Used for Energy Saving Mode.
-    """
+    __slots__ = ("_optimistic_value", "_optimistic_expires", "_last_written")
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
-    _attr_icon = "mdi:home-lightning-bolt"
-    _attr_native_unit_of_measurement = "W"
-    _attr_native_min_value = 300
-    _attr_native_max_value = 1000
-    _attr_native_step = 25
-    _attr_mode = "box"
+    _attr_mode = NumberMode.BOX
+
+    # Used in log and error messages, e.g. "battery backup level to 20%"
+    _setting_label: str
+    _setting_unit: str
 
     def __init__(self, coordinator: EatonBatteryStorageCoordinator) -> None:
-        """Initialize the house consumption threshold number entity."""
+        """Initialize the settings number entity."""
         super().__init__(coordinator)
-        self._attr_unique_id = "eaton_xstorage_set_house_consumption_threshold"
-        self._attr_name = "House consumption threshold"
+        self._attr_device_info = coordinator.device_info
         self._optimistic_value: int | None = None
-
-    @property
-    def device_info(self) -> dict[str, str]:
-        """Return device information."""
-        return self.coordinator.device_info
+        # Loop time after which an unconfirmed written value is dropped
+        self._optimistic_expires = 0.0
+        # (available, native_value) as of the last state write
+        self._last_written: tuple[bool, int | None] | None = None
 
     @property
     def native_value(self) -> int | None:
-        """Return the current house consumption threshold value."""
+        """Return the written value until the device reports it, then its own."""
         if self._optimistic_value is not None:
             return self._optimistic_value
-        try:
-            # Prefer device endpoint data (mirrors active runtime state)
-            device = (
-                self.coordinator.data.get("device", {}) if self.coordinator.data else {}
-            )
-            if isinstance(device, dict):
-                es = device.get("energySavingMode", {})
-                if isinstance(es, dict) and "houseConsumptionThreshold" in es:
-                    return es.get("houseConsumptionThreshold")
-            # Fallback to settings cache
-            settings_data = (
-                self.coordinator.data.get("settings", {})
-                if self.coordinator.data
-                else {}
+        return self._reported_value()
+
+    def _reported_value(self) -> int | None:
+        """Return the value reported by the device."""
+        raise NotImplementedError
+
+    async def _apply_settings_patch(self, value: int, overrides: dict) -> None:
+        """Apply a settings change on the device."""
+        if self.native_value == value:
+            _LOGGER.debug(
+                "%s already set to %d%s, skipping update",
+                self._setting_label,
+                value,
+                self._setting_unit,
             )
-            es2 = (
-                settings_data.get("energySavingMode", {})
-                if isinstance(settings_data, dict)
-                else {}
-            )
-            return es2.get("houseConsumptionThreshold", 300)
-        except (KeyError, TypeError, AttributeError):
-            return 300
+            return
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            self.coordinator.last_update_success and self.coordinator.data is not None
-        )
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set the house consumption threshold value."""
         try:
             # Set optimistic value immediately for responsive UI
-            self._optimistic_value = int(value)
+            self._optimistic_value = value
+            self._optimistic_expires = self.hass.loop.time() + WRITE_CONFIRM_TIMEOUT
             self.async_write_ha_state()
+            self._last_written = (self.available, value)
 
-            # First, get the current settings from the API (not cached data)
-            current_settings_response = await self.coordinator.api.get_settings()
-            if not current_settings_response or not current_settings_response.get(
-                "result"
-            ):
+            result = await self.coordinator.async_update_settings(overrides)
+            if result is None:
                 _LOGGER.error("Failed to get current settings from API")
-                self._optimistic_value = None
+                self._clear_optimistic_value()
                 return
 
-            # Get the current settings data
-            current_settings = current_settings_response.get("result", {})
-
-            # Transform the settings data to match PUT API expectations
-            # The GET API returns objects, but PUT API expects strings/primitives
-            if "country" in current_settings and isinstance(
-                current_settings["country"], dict
-            ):
-                current_settings["country"] = current_settings["country"].get(
-                    "geonameId", ""
-                )
-
-            if "city" in current_settings and isinstance(
-                current_settings["city"], dict
-            ):
-                current_settings["city"] = current_settings["city"].get("geonameId", "")
-
-            if "timezone" in current_settings and isinstance(
-                current_settings["timezone"], dict
-            ):
-                current_settings["timezone"] = current_settings["timezone"].get(
-                    "id", ""
-                )
-
-            # Update only the energySavingMode.houseConsumptionThreshold field
-            if "energySavingMode" not in current_settings:
-                current_settings["energySavingMode"] = {}
-            current_settings["energySavingMode"]["houseConsumptionThreshold"] = int(
-                value
-            )
-
-            # API expects data wrapped in "settings" object
-            payload = {"settings": current_settings}
-
-            result = await self.coordinator.api.update_settings(payload)
-
-            if result.get("successful", result.get("result") is not None):
+            if is_successful(result):
                 _LOGGER.info(
-                    "Successfully set house consumption threshold to %dW", int(value)
+                    "Successfully set %s to %d%s",
+                    self._setting_label,
+                    value,
+                    self._setting_unit,
                 )
-                await asyncio.sleep(2)
-            else:
-                _LOGGER.warning(
-                    "API call completed but may not have succeeded: %s", result
-                )
-                await asyncio.sleep(1)
+                # The accepted value is written through to the settings cache;
+                # the optimistic value is kept until the device reports it
+                return
 
-            # Always refresh the coordinator data
+            _LOGGER.warning("API call completed but may not have succeeded: %s", result)
+            # Clear optimistic value and refresh to get current state
+            self._clear_optimistic_value()
             await self.coordinator.async_request_refresh()
 
-            # Clear optimistic value so we use real data
-            self._optimistic_value = None
-
         except Exception as exc:
-            _LOGGER.error("Error setting house consumption threshold: %s", exc)
+            _LOGGER.error("Error setting %s: %s", self._setting_label, exc)
             # Clear optimistic value and refresh to get current state
-            self._optimistic_value = None
+            self._clear_optimistic_value()
             await self.coordinator.async_request_refresh()
             raise HomeAssistantError(
-                f"Failed to set house consumption threshold to {int(value)}W"
+                f"Failed to set {self._setting_label} to {value}{self._setting_unit}"
             ) from exc
 
+    def _clear_optimistic_value(self) -> None:
+        """Drop the optimistic value and show the reported value."""
+        self._optimistic_value = None
+        self.async_write_ha_state()
+        self._last_written = (self.available, self.native_value)
+
+    @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        # Clear optimistic value when we get real data from coordinator
-        if self._optimistic_value is not None:
+        # Clear the optimistic value once the device reports the written value,
+        # or when it has not done so in time
+        if self._optimistic_value is not None and (
+            self._reported_value() == self._optimistic_value
+            or self.hass.loop.time() >= self._optimistic_expires
+        ):
             self._optimistic_value = None
-        super()._handle_coordinator_update()
+        current = (self.available, self.native_value)
+        if current == self._last_written:
+            return
+        self._last_written = current
+        self.async_write_ha_state()
+
+
+class EatonXStorageHouseConsumptionThresholdNumber(_EatonSettingsNumberBase):
+    """Number entity to control the House Consumption Threshold.
+
+    Used for Energy Saving Mode.
+    """
+
+    _attr_unique_id = "eaton_xstorage_set_house_consumption_threshold"
+    _attr_name = "House consumption threshold"
+    _attr_icon = "mdi:home-lightning-bolt"
+    _attr_native_unit_of_measurement = "W"
+    _attr_native_min_value = 300
+    _attr_native_max_value = 1000
+    _attr_native_step = 25
+    _setting_label = "house consumption threshold"
+    _setting_unit = "W"
+
+    def _reported_value(self) -> int | None:
+        """Return the current house consumption threshold value."""
+        data = self.coordinator.data
+        try:
+            # Prefer device endpoint data (mirrors active runtime state)
+            return data["device"]["energySavingMode"]["houseConsumptionThreshold"]
+        except (KeyError, TypeError):
+            pass
+        try:
+            # Fallback to settings cache
+            return data["settings"]["energySavingMode"].get(
+                "houseConsumptionThreshold", 300
+            )
+        except (KeyError, TypeError, AttributeError):
+            return 300
 
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the house consumption threshold value."""
+        await self._apply_settings_patch(
+            int(value), {"energySavingMode": {"houseConsumptionThreshold": int(value)}}
+        )
 
-class EatonXStorageBatteryBackupLevelNumber(CoordinatorEntity, NumberEntity):
+
+class EatonXStorageBatteryBackupLevelNumber(_EatonSettingsNumberBase):
     """Number entity to control the Battery Backup Level (bmsBackupLevel)."""
 
-    _attr_has_entity_name = True
-    _attr_entity_category = EntityCategory.CONFIG
+    _attr_unique_id = "eaton_xstorage_set_battery_backup_level"
+    _attr_name = "Battery backup level"
     _attr_icon = "mdi:battery-lock"
     _attr_native_unit_of_measurement = "%"
     _attr_native_min_value = 0
     _attr_native_max_value = 100
     _attr_native_step = 1
-    _attr_mode = "box"
-
-    def __init__(self, coordinator: EatonBatteryStorageCoordinator) -> None:
-        """Initialize the battery backup level number entity."""
-        super().__init__(coordinator)
-        self._attr_unique_id = "eaton_xstorage_set_battery_backup_level"
-        self._attr_name = "Battery backup level"
-        self._optimistic_value: int | None = None
+    _setting_label = "battery backup level"
+    _setting_unit = "%"
 
-    @property
-    def native_value(self) -> int | None:
+    def _reported_value(self) -> int | None:
         """Return the current battery backup level value."""
-        if self._optimistic_value is not None:
-            return self._optimistic_value
+        data = self.coordinator.data
         try:
             # Prefer settings cache
-            settings_data = (
-                self.coordinator.data.get("settings", {})
-                if self.coordinator.data
-                else {}
-            )
-            if isinstance(settings_data, dict) and "bmsBackupLevel" in settings_data:
-                return settings_data.get("bmsBackupLevel")
+            return data["settings"]["bmsBackupLevel"]
+        except (KeyError, TypeError):
+            pass
+        try:
             # Fallback to status energyFlow if exposed
-            status = (
-                self.coordinator.data.get("status", {}) if self.coordinator.data else {}
-            )
-            energy_flow = (
-                status.get("energyFlow", {}) if isinstance(status, dict) else {}
-            )
-            if "batteryBackupLevel" in energy_flow:
-                return energy_flow.get("batteryBackupLevel")
+            return data["status"]["energyFlow"]["batteryBackupLevel"]
+        except (KeyError, TypeError):
             return 0
-        except (KeyError, TypeError, AttributeError):
-            return 0
-
-    @property
-    def device_info(self) -> dict[str, str]:
-        """Return device information."""
-        return self.coordinator.device_info
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            self.coordinator.last_update_success and self.coordinator.data is not None
-        )
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the battery backup level value."""
-        try:
-            self._optimistic_value = int(value)
-            self.async_write_ha_state()
-
-            current_settings_response = await self.coordinator.api.get_settings()
-            if not current_settings_response or not current_settings_response.get(
-                "result"
-            ):
-                _LOGGER.error("Failed to get current settings from API")
-                self._optimistic_value = None
-                return
-            current_settings = current_settings_response.get("result", {})
-
-            # Transform composite objects
-            if "country" in current_settings and isinstance(
-                current_settings["country"], dict
-            ):
-                current_settings["country"] = current_settings["country"].get(
-                    "geonameId", ""
-                )
-            if "city" in current_settings and isinstance(
-                current_settings["city"], dict
-            ):
-                current_settings["city"] = current_settings["city"].get("geonameId", "")
-            if "timezone" in current_settings and isinstance(
-                current_settings["timezone"], dict
-            ):
-                current_settings["timezone"] = current_settings["timezone"].get(
-                    "id", ""
-                )
-
-            current_settings["bmsBackupLevel"] = int(value)
-
-            payload = {"settings": current_settings}
-            result = await self.coordinator.api.update_settings(payload)
-            if result.get("successful", result.get("result") is not None):
-                _LOGGER.info(
-                    "Successfully set battery backup level to %d%%", int(value)
-                )
-                await asyncio.sleep(2)
-            else:
-                _LOGGER.warning(
-                    "API call completed but may not have succeeded: %s", result
-                )
-                await asyncio.sleep(1)
-            await self.coordinator.async_request_refresh()
-            self._optimistic_value = None
-        except Exception as exc:
-            _LOGGER.error("Error setting battery backup level: %s", exc)
-            self._optimistic_value = None
-            await self.coordinator.async_request_refresh()
-            raise HomeAssistantError(
-                f"Failed to set battery backup level to {int(value)}%"
-            ) from exc
-
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self._optimistic_value is not None:
-            self._optimistic_value = None
-        super()._handle_coordinator_update()
+        await self._apply_settings_patch(int(value), {"bmsBackupLevel": int(value)})
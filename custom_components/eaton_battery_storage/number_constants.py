@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TypedDict
+from typing import NamedTuple
 
 # Number entity keys
 CHARGE_DURATION = "charge_duration"
@@ -16,107 +16,120 @@ DISCHARGE_POWER_WATT = "discharge_power_watt"
 RUN_DURATION = "run_duration"
 
 
-class NumberEntityDefinition(TypedDict):
+class NumberEntityDefinition(NamedTuple):
     """Type definition for number entity configuration."""
 
     key: str
     name: str
-    min: int
-    max: int
-    step: int
+    min: float
+    max: float
+    step: float
     unit: str
     device_class: str
+    unique_id: str
 
 
-NUMBER_ENTITIES: list[NumberEntityDefinition] = [
-    {
-        "key": CHARGE_DURATION,
-        "name": "Charge Duration",
-        "min": 1,
-        "max": 12,
-        "step": 1,
-        "unit": "h",
-        "device_class": "duration",
-        "default": 1,
-    },
-    {
-        "key": CHARGE_END_SOC,
-        "name": "Charge Target SOC",
-        "min": 0,
-        "max": 100,
-        "step": 1,
-        "unit": "%",
-        "device_class": "battery",
-        "default": 80,
-    },
-    {
-        "key": CHARGE_POWER,
-        "name": "Charge Power (%)",
-        "min": 5,
-        "max": 100,
-        "step": 1,
-        "unit": "%",
-        "device_class": "power",
-        "default": 20,
-    },
-    {
-        "key": CHARGE_POWER_WATT,
-        "name": "Charge Power (Watt)",
-        "min": 180,
-        "max": 3600,
-        "step": 1,
-        "unit": "W",
-        "device_class": "power",
-        # No default for watt, will be set by percent
-    },
-    {
-        "key": DISCHARGE_DURATION,
-        "name": "Discharge Duration",
-        "min": 1,
-        "max": 12,
-        "step": 1,
-        "unit": "h",
-        "device_class": "duration",
-        "default": 1,
-    },
-    {
-        "key": DISCHARGE_END_SOC,
-        "name": "Discharge Target SOC",
-        "min": 0,
-        "max": 100,
-        "step": 1,
-        "unit": "%",
-        "device_class": "battery",
-        "default": 20,
-    },
-    {
-        "key": DISCHARGE_POWER,
-        "name": "Discharge Power (%)",
-        "min": 5,
-        "max": 100,
-        "step": 1,
-        "unit": "%",
-        "device_class": "power",
-        "default": 20,
-    },
-    {
-        "key": DISCHARGE_POWER_WATT,
-        "name": "Discharge Power (Watt)",
-        "min": 180,
-        "max": 3600,
-        "step": 1,
-        "unit": "W",
-        "device_class": "power",
-        # No default for watt, will be set by percent
-    },
-    {
-        "key": RUN_DURATION,
-        "name": "Run Duration",
-        "min": 1,
-        "max": 12,
-        "step": 1,
-        "unit": "h",
-        "device_class": "duration",
-        "default": 1,
-    },
-]
+NUMBER_ENTITIES: tuple[NumberEntityDefinition, ...] = (
+    NumberEntityDefinition(
+        key=CHARGE_DURATION,
+        name="Charge Duration",
+        min=1.0,
+        max=12.0,
+        step=1.0,
+        unit="h",
+        device_class="duration",
+        unique_id=f"eaton_battery_{CHARGE_DURATION}",
+    ),
+    NumberEntityDefinition(
+        key=CHARGE_END_SOC,
+        name="Charge Target SOC",
+        min=0.0,
+        max=100.0,
+        step=1.0,
+        unit="%",
+        device_class="battery",
+        unique_id=f"eaton_battery_{CHARGE_END_SOC}",
+    ),
+    NumberEntityDefinition(
+        key=CHARGE_POWER,
+        name="Charge Power (%)",
+        min=5.0,
+        max=100.0,
+        step=1.0,
+        unit="%",
+        device_class="power",
+        unique_id=f"eaton_battery_{CHARGE_POWER}",
+    ),
+    NumberEntityDefinition(
+        key=CHARGE_POWER_WATT,
+        name="Charge Power (Watt)",
+        min=180.0,
+        max=3600.0,
+        step=1.0,
+        unit="W",
+        device_class="power",
+        unique_id=f"eaton_battery_{CHARGE_POWER_WATT}",
+    ),
+    NumberEntityDefinition(
+        key=DISCHARGE_DURATION,
+        name="Discharge Duration",
+        min=1.0,
+        max=12.0,
+        step=1.0,
+        unit="h",
+        device_class="duration",
+        unique_id=f"eaton_battery_{DISCHARGE_DURATION}",
+    ),
+    NumberEntityDefinition(
+        key=DISCHARGE_END_SOC,
+        name="Discharge Target SOC",
+        min=0.0,
+        max=100.0,
+        step=1.0,
+        unit="%",
+        device_class="battery",
+        unique_id=f"eaton_battery_{DISCHARGE_END_SOC}",
+    ),
+    NumberEntityDefinition(
+        key=DISCHARGE_POWER,
+        name="Discharge Power (%)",
+        min=5.0,
+        max=100.0,
+        step=1.0,
+        unit="%",
+        device_class="power",
+        unique_id=f"eaton_battery_{DISCHARGE_POWER}",
+    ),
+    NumberEntityDefinition(
+        key=DISCHARGE_POWER_WATT,
+        name="Discharge Power (Watt)",
+        min=180.0,
+        max=3600.0,
+        step=1.0,
+        unit="W",
+        device_class="power",
+        unique_id=f"eaton_battery_{DISCHARGE_POWER_WATT}",
+    ),
+    NumberEntityDefinition(
+        key=RUN_DURATION,
+        name="Run Duration",
+        min=1.0,
+        max=12.0,
+        step=1.0,
+        unit="h",
+        device_class="duration",
+        unique_id=f"eaton_battery_{RUN_DURATION}",
+    ),
+)
+
+# Initial values for entities without a stored value; the watt entities are
+# derived from their percentage counterparts
+NUMBER_DEFAULTS: dict[str, int] = {
+    CHARGE_DURATION: 1,
+    CHARGE_END_SOC: 80,
+    CHARGE_POWER: 20,
+    DISCHARGE_DURATION: 1,
+    DISCHARGE_END_SOC: 20,
+    DISCHARGE_POWER: 20,
+    RUN_DURATION: 1,
+}
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.select import SelectEntity
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api import is_successful
+
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
@@ -28,6 +33,105 @@ DEFAULT_MODE_OPTIONS: list[tuple[str, str]] = [
     ("Peak Shaving", "SET_PEAK_SHAVING"),
 ]
 
+# Manual modes only available as immediate commands
+MANUAL_MODE_OPTIONS: list[tuple[str, str]] = [
+    ("Manual Charge", "SET_CHARGE"),
+    ("Manual Discharge", "SET_DISCHARGE"),
+]
+CURRENT_MODE_OPTIONS: list[tuple[str, str]] = DEFAULT_MODE_OPTIONS + MANUAL_MODE_OPTIONS
+
+# Read-only stand-in for missing coordinator data
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Lookup tables shared by all entity instances
+_DEFAULT_OPTIONS = [label for (label, _) in DEFAULT_MODE_OPTIONS]
+_DEFAULT_OPTION_TO_CMD = MappingProxyType(dict(DEFAULT_MODE_OPTIONS))
+_DEFAULT_CMD_TO_LABEL = MappingProxyType(
+    {cmd: label for (label, cmd) in DEFAULT_MODE_OPTIONS}
+)
+_CURRENT_OPTIONS = [label for (label, _) in CURRENT_MODE_OPTIONS]
+_CURRENT_OPTION_TO_CMD = MappingProxyType(dict(CURRENT_MODE_OPTIONS))
+_CURRENT_CMD_TO_LABEL = MappingProxyType(
+    {cmd: label for (label, cmd) in CURRENT_MODE_OPTIONS}
+)
+
+
+def _params_none(
+    settings: Mapping[str, Any], status: Mapping[str, Any], helpers: Mapping[str, int]
+) -> dict[str, Any]:
+    """Return parameters for modes that take none."""
+    return {}
+
+
+def _params_charge(
+    settings: Mapping[str, Any], status: Mapping[str, Any], helpers: Mapping[str, int]
+) -> dict[str, Any]:
+    """Return manual charge parameters from the number helpers."""
+    return {
+        "action": "ACTION_CHARGE",
+        "power": helpers.get("charge_power", 15),  # percentage
+        "soc": helpers.get("charge_end_soc", 90),
+    }
+
+
+def _params_discharge(
+    settings: Mapping[str, Any], status: Mapping[str, Any], helpers: Mapping[str, int]
+) -> dict[str, Any]:
+    """Return manual discharge parameters from the number helpers."""
+    return {
+        "action": "ACTION_DISCHARGE",
+        "power": helpers.get("discharge_power", 15),  # percentage
+        "soc": helpers.get("discharge_end_soc", 10),
+    }
+
+
+def _params_peak_shaving(
+    settings: Mapping[str, Any], status: Mapping[str, Any], helpers: Mapping[str, int]
+) -> dict[str, Any]:
+    """Use the house consumption threshold as maximum peak consumption."""
+    esm = settings.get("energySavingMode") or _EMPTY
+    max_peak = esm.get("houseConsumptionThreshold")
+    if not isinstance(max_peak, (int, float)):
+        max_peak = 1000
+    return {"maxHousePeakConsumption": int(max_peak)}
+
+
+def _params_variable_grid_injection(
+    settings: Mapping[str, Any], status: Mapping[str, Any], helpers: Mapping[str, int]
+) -> dict[str, Any]:
+    """Return grid injection parameters, 0W unless a helper is added later."""
+    return {"maximumPower": 0}
+
+
+def _params_frequency_regulation(
+    settings: Mapping[str, Any], status: Mapping[str, Any], helpers: Mapping[str, int]
+) -> dict[str, Any]:
+    """Use the battery backup level as a reasonable default for optimal SOC."""
+    optimal_soc = settings.get("bmsBackupLevel")
+    if not isinstance(optimal_soc, (int, float)):
+        # fallback from status if present
+        energy_flow = status.get("energyFlow") or _EMPTY
+        optimal_soc = energy_flow.get("batteryBackupLevel")
+        if not isinstance(optimal_soc, (int, float)):
+            optimal_soc = 28
+    return {"powerAllocation": 0, "optimalSoc": int(optimal_soc)}
+
+
+type ParamBuilder = Callable[
+    [Mapping[str, Any], Mapping[str, Any], Mapping[str, int]], dict[str, Any]
+]
+
+# Command parameter builders shared by both operation mode selects
+_PARAM_BUILDERS: Mapping[str, ParamBuilder] = MappingProxyType(
+    {
+        "SET_CHARGE": _params_charge,
+        "SET_DISCHARGE": _params_discharge,
+        "SET_PEAK_SHAVING": _params_peak_shaving,
+        "SET_VARIABLE_GRID_INJECTION": _params_variable_grid_injection,
+        "SET_FREQUENCY_REGULATION": _params_frequency_regulation,
+    }
+)
+
 
 async def async_setup_entry(
     _hass: HomeAssistant,
@@ -54,42 +158,28 @@ class EatonXStorageDefaultOperationModeSelect(CoordinatorEntity, SelectEntity):
     def __init__(self, coordinator: EatonBatteryStorageCoordinator) -> None:
         """Initialize the select entity."""
         super().__init__(coordinator)
+        self._attr_device_info = coordinator.device_info
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_default_operation_mode"
         )
         self._attr_name = "Default operation mode"
-        self._options = [label for (label, _) in DEFAULT_MODE_OPTIONS]
-        self._option_to_cmd = {label: cmd for (label, cmd) in DEFAULT_MODE_OPTIONS}
-        self._cmd_to_label = {cmd: label for (label, cmd) in DEFAULT_MODE_OPTIONS}
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        return self.coordinator.device_info
-
-    @property
-    def options(self) -> list[str]:
-        """Return list of available options."""
-        return self._options
+        self._attr_options = _DEFAULT_OPTIONS
+        self._option_to_cmd = _DEFAULT_OPTION_TO_CMD
+        self._cmd_to_label = _DEFAULT_CMD_TO_LABEL
+        self._optimistic_option: str | None = None
 
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
+        if self._optimistic_option is not None:
+            return self._optimistic_option
+        data = self.coordinator.data or _EMPTY
         try:
-            settings = (
-                self.coordinator.data.get("settings", {})
-                if self.coordinator.data
-                else {}
-            )
-            default_mode = (
-                settings.get("defaultMode", {}) if isinstance(settings, dict) else {}
-            )
-            cmd = default_mode.get("command")
-            if cmd and cmd in self._cmd_to_label:
-                return self._cmd_to_label[cmd]
-        except Exception:
-            pass
-        return None
+            settings = data.get("settings") or _EMPTY
+            cmd = (settings.get("defaultMode") or _EMPTY).get("command")
+        except AttributeError:
+            return None
+        return self._cmd_to_label.get(cmd)
 
     @property
     def available(self) -> bool:
@@ -104,104 +194,69 @@ class EatonXStorageDefaultOperationModeSelect(CoordinatorEntity, SelectEntity):
             _LOGGER.error("Invalid operation mode option: %s", option)
             return
 
+        if option == self.current_option:
+            _LOGGER.debug("Default operation mode already set to %s", option)
+            return
+
+        # Show the selected option immediately for a responsive UI
+        self._optimistic_option = option
+        self.async_write_ha_state()
+
+        api_call_attempted = False
         try:
-            # Always fetch the latest settings
-            current_settings_response = await self.coordinator.api.get_settings()
-            if not current_settings_response or not current_settings_response.get(
-                "result"
-            ):
+            # Determine parameters from the data cached by the last refresh
+            command = self._option_to_cmd[option]
+            data = self.coordinator.data or _EMPTY
+            parameters = _PARAM_BUILDERS.get(command, _params_none)(
+                data.get("settings") or _EMPTY,
+                data.get("status") or _EMPTY,
+                self.coordinator.number_values,
+            )
+
+            # Set defaultMode with chosen command and computed parameters,
+            # replacing it whole so parameters of the previous mode are dropped
+            overrides = {"defaultMode": {"command": command, "parameters": parameters}}
+            payload = await self.coordinator.async_build_settings_payload(
+                overrides, replace=True
+            )
+            if payload is None:
                 _LOGGER.error("Failed to get current settings from API")
+                self._optimistic_option = None
+                self.async_write_ha_state()
                 return
-            current_settings = current_settings_response.get("result", {})
-
-            # Transform composite objects expected as strings on PUT
-            if "country" in current_settings and isinstance(
-                current_settings["country"], dict
-            ):
-                current_settings["country"] = current_settings["country"].get(
-                    "geonameId", ""
-                )
-            if "city" in current_settings and isinstance(
-                current_settings["city"], dict
-            ):
-                current_settings["city"] = current_settings["city"].get("geonameId", "")
-            if "timezone" in current_settings and isinstance(
-                current_settings["timezone"], dict
-            ):
-                current_settings["timezone"] = current_settings["timezone"].get(
-                    "id", ""
-                )
 
-            # Determine parameters based on selected mode and available helper/settings values
-            command = self._option_to_cmd[option]
-            parameters = {}
-
-            try:
-                if command == "SET_PEAK_SHAVING":
-                    # Use energySavingMode.houseConsumptionThreshold if available
-                    esm = (
-                        current_settings.get("energySavingMode", {})
-                        if isinstance(current_settings, dict)
-                        else {}
-                    )
-                    max_peak = None
-                    if isinstance(esm, dict):
-                        max_peak = esm.get("houseConsumptionThreshold")
-                    if isinstance(max_peak, (int, float)):
-                        parameters = {"maxHousePeakConsumption": int(max_peak)}
-                elif command == "SET_VARIABLE_GRID_INJECTION":
-                    # Default to 0W unless a helper is added later
-                    parameters = {"maximumPower": 0}
-                elif command == "SET_FREQUENCY_REGULATION":
-                    # Use current backup level as a reasonable default for optimal SOC
-                    optimal_soc = current_settings.get("bmsBackupLevel")
-                    if not isinstance(optimal_soc, (int, float)):
-                        # fallback from status if present
-                        status = (
-                            self.coordinator.data.get("status", {})
-                            if self.coordinator.data
-                            else {}
-                        )
-                        energy_flow = (
-                            status.get("energyFlow", {})
-                            if isinstance(status, dict)
-                            else {}
-                        )
-                        optimal_soc = energy_flow.get("batteryBackupLevel", 28)
-                    parameters = {"powerAllocation": 0, "optimalSoc": int(optimal_soc)}
-                else:
-                    parameters = {}
-            except Exception:
-                parameters = {}
-
-            # Set defaultMode with chosen command and computed parameters
-            current_settings["defaultMode"] = {
-                "command": command,
-                "parameters": parameters,
-            }
-
-            payload = {"settings": current_settings}
-            result = await self.coordinator.api.update_settings(payload)
-            if result.get("successful", result.get("result") is not None):
+            api_call_attempted = True
+            result = await self.coordinator.async_put_settings(
+                payload, overrides, replace=True
+            )
+            if is_successful(result):
                 _LOGGER.info("Default operation mode set to %s", option)
-                # Give device time to apply the change
-                await asyncio.sleep(2)
             else:
                 _LOGGER.warning(
                     "Default mode API call may not have succeeded: %s", result
                 )
-                await asyncio.sleep(1)
-            
-            # Refresh to get the latest state from device
-            await self.coordinator.async_request_refresh()
-            
+                # Refresh to get the latest state from device
+                self._optimistic_option = None
+                self.async_write_ha_state()
+                await self.coordinator.async_request_refresh()
+
         except Exception as e:
             _LOGGER.error("Error setting default operation mode: %s", e)
-            await self.coordinator.async_request_refresh()
-
-    def select_option(self, option: str) -> None:
-        """Change the selected option."""
-        asyncio.create_task(self.async_select_option(option))
+            self._optimistic_option = None
+            self.async_write_ha_state()
+            # Only re-poll when the device may have been changed
+            if api_call_attempted:
+                await self.coordinator.async_request_refresh()
+            raise HomeAssistantError(
+                f"Failed to set default operation mode to {option}"
+            ) from e
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Clear optimistic option when we get real data from coordinator
+        self._optimistic_option = None
+        self.async_write_ha_state()
 
 
 class EatonXStorageCurrentOperationModeSelect(CoordinatorEntity, SelectEntity):
@@ -217,49 +272,28 @@ class EatonXStorageCurrentOperationModeSelect(CoordinatorEntity, SelectEntity):
     def __init__(self, coordinator: EatonBatteryStorageCoordinator) -> None:
         """Initialize the select entity."""
         super().__init__(coordinator)
+        self._attr_device_info = coordinator.device_info
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_current_operation_mode"
         )
         self._attr_name = "Current operation mode"
-        self._options = [label for (label, _) in DEFAULT_MODE_OPTIONS] + [
-            "Manual Charge",
-            "Manual Discharge",
-        ]
-        self._option_to_cmd = {label: cmd for (label, cmd) in DEFAULT_MODE_OPTIONS}
-        self._option_to_cmd.update(
-            {"Manual Charge": "SET_CHARGE", "Manual Discharge": "SET_DISCHARGE"}
-        )
-        self._cmd_to_label = {cmd: label for (label, cmd) in DEFAULT_MODE_OPTIONS}
-        self._cmd_to_label.update(
-            {"SET_CHARGE": "Manual Charge", "SET_DISCHARGE": "Manual Discharge"}
-        )
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        return self.coordinator.device_info
-
-    @property
-    def options(self) -> list[str]:
-        """Return list of available options."""
-        return self._options
+        self._attr_options = _CURRENT_OPTIONS
+        self._option_to_cmd = _CURRENT_OPTION_TO_CMD
+        self._cmd_to_label = _CURRENT_CMD_TO_LABEL
+        self._optimistic_option: str | None = None
 
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
+        if self._optimistic_option is not None:
+            return self._optimistic_option
+        data = self.coordinator.data or _EMPTY
         try:
-            status = (
-                self.coordinator.data.get("status", {}) if self.coordinator.data else {}
-            )
-            current_mode = (
-                status.get("currentMode", {}) if isinstance(status, dict) else {}
-            )
-            cmd = current_mode.get("command")
-            if cmd and cmd in self._cmd_to_label:
-                return self._cmd_to_label[cmd]
-        except Exception:
-            pass
-        return None
+            status = data.get("status") or _EMPTY
+            cmd = (status.get("currentMode") or _EMPTY).get("command")
+        except AttributeError:
+            return None
+        return self._cmd_to_label.get(cmd)
 
     @property
     def available(self) -> bool:
@@ -274,11 +308,16 @@ class EatonXStorageCurrentOperationModeSelect(CoordinatorEntity, SelectEntity):
             _LOGGER.error("Invalid current operation mode option: %s", option)
             return
 
+        # Show the selected option immediately for a responsive UI
+        self._optimistic_option = option
+        self.async_write_ha_state()
+
+        api_call_attempted = False
         try:
             command = self._option_to_cmd[option]
 
             # Get helper values from coordinator storage
-            helper_values = getattr(self.coordinator, "number_values", {})
+            helper_values = self.coordinator.number_values
 
             # Determine duration based on command type
             duration = 1  # default fallback
@@ -299,77 +338,45 @@ class EatonXStorageCurrentOperationModeSelect(CoordinatorEntity, SelectEntity):
                 )
 
             # Build parameters based on command type
-            parameters = {}
-
-            if command == "SET_CHARGE":
-                parameters = {
-                    "action": "ACTION_CHARGE",
-                    "power": int(helper_values.get("charge_power", 15)),  # percentage
-                    "soc": int(helper_values.get("charge_end_soc", 90)),
-                }
-            elif command == "SET_DISCHARGE":
-                parameters = {
-                    "action": "ACTION_DISCHARGE",
-                    "power": int(
-                        helper_values.get("discharge_power", 15)
-                    ),  # percentage
-                    "soc": int(helper_values.get("discharge_end_soc", 10)),
-                }
-            elif command == "SET_PEAK_SHAVING":
-                # Get current settings for house consumption threshold
-                settings = (
-                    self.coordinator.data.get("settings", {})
-                    if self.coordinator.data
-                    else {}
-                )
-                esm = (
-                    settings.get("energySavingMode", {})
-                    if isinstance(settings, dict)
-                    else {}
-                )
-                max_peak = (
-                    esm.get("houseConsumptionThreshold", 1000)
-                    if isinstance(esm, dict)
-                    else 1000
-                )
-                parameters = {"maxHousePeakConsumption": int(max_peak)}
-            elif command == "SET_VARIABLE_GRID_INJECTION":
-                parameters = {
-                    "maximumPower": 0
-                }  # Could be extended with helper value later
-            elif command == "SET_FREQUENCY_REGULATION":
-                # Use backup level as optimal SOC
-                settings = (
-                    self.coordinator.data.get("settings", {})
-                    if self.coordinator.data
-                    else {}
-                )
-                optimal_soc = (
-                    settings.get("bmsBackupLevel", 28)
-                    if isinstance(settings, dict)
-                    else 28
-                )
-                parameters = {"powerAllocation": 0, "optimalSoc": int(optimal_soc)}
+            data = self.coordinator.data or _EMPTY
+            parameters = _PARAM_BUILDERS.get(command, _params_none)(
+                data.get("settings") or _EMPTY,
+                data.get("status") or _EMPTY,
+                helper_values,
+            )
 
+            api_call_attempted = True
             result = await self.coordinator.api.send_device_command(
-                command, int(duration), parameters
+                command, duration, parameters
             )
 
-            if result.get("successful", result.get("result") is not None):
+            if is_successful(result):
                 _LOGGER.info(
                     "Current operation mode set to %s for %d hours", option, duration
                 )
-                # Give device time to apply the change
-                await asyncio.sleep(2)
             else:
                 _LOGGER.warning(
                     "Current mode API call may not have succeeded: %s", result
                 )
-                await asyncio.sleep(1)
-
-            # Refresh to get the latest state from device
-            await self.coordinator.async_request_refresh()
+                # Refresh to get the latest state from device
+                self._optimistic_option = None
+                self.async_write_ha_state()
+                await self.coordinator.async_request_refresh()
 
         except Exception as e:
             _LOGGER.error("Error setting current operation mode: %s", e)
-            await self.coordinator.async_request_refresh()
+            self._optimistic_option = None
+            self.async_write_ha_state()
+            # Only re-poll when the device may have been changed
+            if api_call_attempted:
+                await self.coordinator.async_request_refresh()
+            raise HomeAssistantError(
+                f"Failed to set current operation mode to {option}"
+            ) from e
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Clear optimistic option when we get real data from coordinator
+        self._optimistic_option = None
+        self.async_write_ha_state()
@@ -26,12 +26,17 @@ Sensors with accuracy issues are marked with accuracy_warning=True in SENSOR_TYP
 from __future__ import annotations
 
 import logging
-from typing import Any
+import time
+from collections.abc import Callable, Mapping, Sequence
+from functools import partial
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, PERCENTAGE, UnitOfPower
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -43,660 +48,689 @@ from .const import (
     CURRENT_MODE_TYPE_MAP,
     OPERATION_MODE_MAP,
     POWER_ACCURACY_WARNING,
+    TECHNICIAN_ONLY_SENSORS,
 )
 from .coordinator import EatonXstorageHomeCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-SENSOR_TYPES = {
+# Minimum seconds between repeated BMS cell voltage errors for a sensor
+VOLTAGE_ERROR_LOG_INTERVAL = 60.0
+
+# Shared fallback for missing objects in the API data
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+class SensorDescription(NamedTuple):
+    """Type definition for sensor entity configuration."""
+
+    name: str
+    unit: str | None
+    device_class: str | None
+    entity_category: EntityCategory | None
+    icon: str | None = None
+    pv_related: bool = False
+    accuracy_warning: bool = False
+    disabled_by_default: bool = False
+    precision: int | None = None
+
+
+SENSOR_TYPES: dict[str, SensorDescription] = {
     # status endpoint
-    "status.currentMode.command": {
-        "name": "Current Mode Command",
-        "unit": None,
-        "device_class": None,
-        "entity_category": None,
-        "icon": "mdi:gesture-tap-button",
-    },
-    "status.currentMode.duration": {
-        "name": "Current Mode Duration",
-        "unit": None,
-        "device_class": None,
-        "entity_category": None,
-        "icon": "mdi:timer-outline",
-    },
-    "status.currentMode.startTime": {
-        "name": "Current Mode Start Time",
-        "unit": None,
-        "device_class": None,
-        "entity_category": None,
-        "icon": "mdi:clock-start",
-    },
-    "status.currentMode.endTime": {
-        "name": "Current Mode End Time",
-        "unit": None,
-        "device_class": None,
-        "entity_category": None,
-        "icon": "mdi:clock-end",
-    },
-    "status.currentMode.recurrence": {
-        "name": "Current Mode Recurrence",
-        "unit": None,
-        "device_class": None,
-        "entity_category": None,
-        "icon": "mdi:calendar-refresh",
-    },
-    "status.currentMode.type": {
-        "name": "Current Mode Type",
-        "unit": None,
-        "device_class": None,
-        "entity_category": None,
-        "icon": "mdi:format-list-bulleted-type",
-    },
-    "status.currentMode.parameters.action": {
-        "name": "Current Mode Action",
-        "unit": None,
-        "device_class": None,
-        "entity_category": None,
-        "icon": "mdi:play-outline",
-    },
-    "status.currentMode.parameters.power": {
-        "name": "Current Mode Power",
-        "unit": None,
-        "device_class": None,
-        "entity_category": None,
-        "icon": "mdi:flash",
-    },
-    "status.currentMode.parameters.soc": {
-        "name": "Current Mode SOC",
-        "unit": PERCENTAGE,
-        "device_class": "battery",
-        "entity_category": None,
-    },
-    "status.energyFlow.acPvRole": {
-        "name": "AC PV Role",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "pv_related": True,
-        "icon": "mdi:solar-power",
-    },
+    "status.currentMode.command": SensorDescription(
+        name="Current Mode Command",
+        unit=None,
+        device_class=None,
+        entity_category=None,
+        icon="mdi:gesture-tap-button",
+    ),
+    "status.currentMode.duration": SensorDescription(
+        name="Current Mode Duration",
+        unit=None,
+        device_class=None,
+        entity_category=None,
+        icon="mdi:timer-outline",
+    ),
+    "status.currentMode.startTime": SensorDescription(
+        name="Current Mode Start Time",
+        unit=None,
+        device_class=None,
+        entity_category=None,
+        icon="mdi:clock-start",
+    ),
+    "status.currentMode.endTime": SensorDescription(
+        name="Current Mode End Time",
+        unit=None,
+        device_class=None,
+        entity_category=None,
+        icon="mdi:clock-end",
+    ),
+    "status.currentMode.recurrence": SensorDescription(
+        name="Current Mode Recurrence",
+        unit=None,
+        device_class=None,
+        entity_category=None,
+        icon="mdi:calendar-refresh",
+    ),
+    "status.currentMode.type": SensorDescription(
+        name="Current Mode Type",
+        unit=None,
+        device_class=None,
+        entity_category=None,
+        icon="mdi:format-list-bulleted-type",
+    ),
+    "status.currentMode.parameters.action": SensorDescription(
+        name="Current Mode Action",
+        unit=None,
+        device_class=None,
+        entity_category=None,
+        icon="mdi:play-outline",
+    ),
+    "status.currentMode.parameters.power": SensorDescription(
+        name="Current Mode Power",
+        unit=None,
+        device_class=None,
+        entity_category=None,
+        icon="mdi:flash",
+    ),
+    "status.currentMode.parameters.soc": SensorDescription(
+        name="Current Mode SOC",
+        unit=PERCENTAGE,
+        device_class="battery",
+        entity_category=None,
+    ),
+    "status.energyFlow.acPvRole": SensorDescription(
+        name="AC PV Role",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        pv_related=True,
+        icon="mdi:solar-power",
+    ),
     # WARNING: Inverter power measurements are typically 10%-30% higher than actual values - accuracy is poor
-    "status.energyFlow.acPvValue": {
-        "name": "AC PV Value",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "entity_category": None,
-        "pv_related": True,
-        "accuracy_warning": True,
-    },
-    "status.energyFlow.batteryBackupLevel": {
-        "name": "Battery Backup Level",
-        "unit": PERCENTAGE,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "disabled_by_default": True,
-        "icon": "mdi:battery-heart-outline",
-    },
-    "status.energyFlow.batteryStatus": {
-        "name": "Battery Status",
-        "unit": None,
-        "device_class": None,
-        "entity_category": None,
-        "icon": "mdi:battery",
-    },
-    "status.energyFlow.batteryEnergyFlow": {
-        "name": "Battery Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "entity_category": None,
-    },
-    "status.energyFlow.criticalLoadRole": {
-        "name": "Critical Load Role",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:alert-octagon-outline",
-    },
+    "status.energyFlow.acPvValue": SensorDescription(
+        name="AC PV Value",
+        unit=UnitOfPower.WATT,
+        device_class="power",
+        entity_category=None,
+        pv_related=True,
+        accuracy_warning=True,
+    ),
+    "status.energyFlow.batteryBackupLevel": SensorDescription(
+        name="Battery Backup Level",
+        unit=PERCENTAGE,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        disabled_by_default=True,
+        icon="mdi:battery-heart-outline",
+    ),
+    "status.energyFlow.batteryStatus": SensorDescription(
+        name="Battery Status",
+        unit=None,
+        device_class=None,
+        entity_category=None,
+        icon="mdi:battery",
+    ),
+    "status.energyFlow.batteryEnergyFlow": SensorDescription(
+        name="Battery Power",
+        unit=UnitOfPower.WATT,
+        device_class="power",
+        entity_category=None,
+    ),
+    "status.energyFlow.criticalLoadRole": SensorDescription(
+        name="Critical Load Role",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:alert-octagon-outline",
+    ),
     # WARNING: Inverter power measurements are typically 10%-30% higher than actual values - accuracy is poor
-    "status.energyFlow.criticalLoadValue": {
-        "name": "Critical Load Value",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "entity_category": None,
-        "accuracy_warning": True,
-    },
-    "status.energyFlow.dcPvRole": {
-        "name": "DC PV Role",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "pv_related": True,
-        "icon": "mdi:solar-power",
-    },
+    "status.energyFlow.criticalLoadValue": SensorDescription(
+        name="Critical Load Value",
+        unit=UnitOfPower.WATT,
+        device_class="power",
+        entity_category=None,
+        accuracy_warning=True,
+    ),
+    "status.energyFlow.dcPvRole": SensorDescription(
+        name="DC PV Role",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        pv_related=True,
+        icon="mdi:solar-power",
+    ),
     # WARNING: Inverter power measurements are typically 10%-30% higher than actual values - accuracy is poor
-    "status.energyFlow.dcPvValue": {
-        "name": "DC PV Value",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "entity_category": None,
-        "pv_related": True,
-        "accuracy_warning": True,
-    },
-    "status.energyFlow.gridRole": {
-        "name": "Grid Role",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:transmission-tower",
-    },
+    "status.energyFlow.dcPvValue": SensorDescription(
+        name="DC PV Value",
+        unit=UnitOfPower.WATT,
+        device_class="power",
+        entity_category=None,
+        pv_related=True,
+        accuracy_warning=True,
+    ),
+    "status.energyFlow.gridRole": SensorDescription(
+        name="Grid Role",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:transmission-tower",
+    ),
     # WARNING: Inverter power measurements are typically 10%-30% higher than actual values - accuracy is poor
-    "status.energyFlow.gridValue": {
-        "name": "Grid Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "entity_category": None,
-        "accuracy_warning": True,
-    },
-    "status.energyFlow.nonCriticalLoadRole": {
-        "name": "Non-Critical Load Role",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:power-socket",
-    },
+    "status.energyFlow.gridValue": SensorDescription(
+        name="Grid Power",
+        unit=UnitOfPower.WATT,
+        device_class="power",
+        entity_category=None,
+        accuracy_warning=True,
+    ),
+    "status.energyFlow.nonCriticalLoadRole": SensorDescription(
+        name="Non-Critical Load Role",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:power-socket",
+    ),
     # WARNING: Inverter power measurements are typically 10%-30% higher than actual values - accuracy is poor
-    "status.energyFlow.nonCriticalLoadValue": {
-        "name": "Non-Critical Load Value",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "entity_category": None,
-        "accuracy_warning": True,
-    },
-    "status.energyFlow.operationMode": {
-        "name": "Operation Mode",
-        "unit": None,
-        "device_class": None,
-        "entity_category": None,
-        "icon": "mdi:cog-outline",
-    },
+    "status.energyFlow.nonCriticalLoadValue": SensorDescription(
+        name="Non-Critical Load Value",
+        unit=UnitOfPower.WATT,
+        device_class="power",
+        entity_category=None,
+        accuracy_warning=True,
+    ),
+    "status.energyFlow.operationMode": SensorDescription(
+        name="Operation Mode",
+        unit=None,
+        device_class=None,
+        entity_category=None,
+        icon="mdi:cog-outline",
+    ),
     # WARNING: Inverter power measurements are typically 10%-30% higher than actual values - accuracy is poor
-    "status.energyFlow.selfConsumption": {
-        "name": "Self Consumption",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "entity_category": None,
-        "accuracy_warning": True,
-    },
-    "status.energyFlow.selfSufficiency": {
-        "name": "Self Sufficiency",
-        "unit": PERCENTAGE,
-        "device_class": None,
-        "entity_category": None,
-        "icon": "mdi:gauge",
-    },
-    "status.energyFlow.stateOfCharge": {
-        "name": "Battery State of Charge",
-        "unit": PERCENTAGE,
-        "device_class": "battery",
-        "entity_category": None,
-    },
-    "status.energyFlow.energySavingModeEnabled": {
-        "name": "Energy Saving Mode Enabled",
-        "unit": None,
-        "device_class": None,
-        "entity_category": None,
-        "icon": "mdi:leaf",
-    },
-    "status.energyFlow.energySavingModeActivated": {
-        "name": "Energy Saving Mode Activated",
-        "unit": None,
-        "device_class": None,
-        "entity_category": None,
-        "icon": "mdi:leaf-circle",
-    },
+    "status.energyFlow.selfConsumption": SensorDescription(
+        name="Self Consumption",
+        unit=UnitOfPower.WATT,
+        device_class="power",
+        entity_category=None,
+        accuracy_warning=True,
+    ),
+    "status.energyFlow.selfSufficiency": SensorDescription(
+        name="Self Sufficiency",
+        unit=PERCENTAGE,
+        device_class=None,
+        entity_category=None,
+        icon="mdi:gauge",
+    ),
+    "status.energyFlow.stateOfCharge": SensorDescription(
+        name="Battery State of Charge",
+        unit=PERCENTAGE,
+        device_class="battery",
+        entity_category=None,
+    ),
+    "status.energyFlow.energySavingModeEnabled": SensorDescription(
+        name="Energy Saving Mode Enabled",
+        unit=None,
+        device_class=None,
+        entity_category=None,
+        icon="mdi:leaf",
+    ),
+    "status.energyFlow.energySavingModeActivated": SensorDescription(
+        name="Energy Saving Mode Activated",
+        unit=None,
+        device_class=None,
+        entity_category=None,
+        icon="mdi:leaf-circle",
+    ),
     # WARNING: 30-day metrics disabled by default - inverter measurements are typically 10%-30% higher than actual values
-    "status.last30daysEnergyFlow.gridConsumption": {
-        "name": "30 Days Grid Consumption",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "disabled_by_default": True,
-        "accuracy_warning": True,
-    },
-    "status.last30daysEnergyFlow.photovoltaicProduction": {
-        "name": "30 Days PV Production",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "pv_related": True,
-        "disabled_by_default": True,
-        "accuracy_warning": True,
-    },
-    "status.last30daysEnergyFlow.selfConsumption": {
-        "name": "30 Days Self Consumption",
-        "unit": PERCENTAGE,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "disabled_by_default": True,
-        "accuracy_warning": True,
-        "icon": "mdi:calendar-clock",
-    },
-    "status.last30daysEnergyFlow.selfSufficiency": {
-        "name": "30 Days Self Sufficiency",
-        "unit": PERCENTAGE,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "disabled_by_default": True,
-        "accuracy_warning": True,
-        "icon": "mdi:calendar-gauge",
-    },
+    "status.last30daysEnergyFlow.gridConsumption": SensorDescription(
+        name="30 Days Grid Consumption",
+        unit=UnitOfPower.WATT,
+        device_class="power",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        disabled_by_default=True,
+        accuracy_warning=True,
+    ),
+    "status.last30daysEnergyFlow.photovoltaicProduction": SensorDescription(
+        name="30 Days PV Production",
+        unit=UnitOfPower.WATT,
+        device_class="power",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        pv_related=True,
+        disabled_by_default=True,
+        accuracy_warning=True,
+    ),
+    "status.last30daysEnergyFlow.selfConsumption": SensorDescription(
+        name="30 Days Self Consumption",
+        unit=PERCENTAGE,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        disabled_by_default=True,
+        accuracy_warning=True,
+        icon="mdi:calendar-clock",
+    ),
+    "status.last30daysEnergyFlow.selfSufficiency": SensorDescription(
+        name="30 Days Self Sufficiency",
+        unit=PERCENTAGE,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        disabled_by_default=True,
+        accuracy_warning=True,
+        icon="mdi:calendar-gauge",
+    ),
     # WARNING: Today's metrics also affected by inverter accuracy issues
-    "status.today.gridConsumption": {
-        "name": "Today's Grid Consumption",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "disabled_by_default": True,
-        "accuracy_warning": True,
-    },
-    "status.today.photovoltaicProduction": {
-        "name": "Today's PV Production",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "entity_category": None,
-        "pv_related": True,
-        "accuracy_warning": True,
-    },
-    "status.today.selfConsumption": {
-        "name": "Today's Self Consumption",
-        "unit": PERCENTAGE,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "disabled_by_default": True,
-        "accuracy_warning": True,
-        "icon": "mdi:clock-outline",
-    },
-    "status.today.selfSufficiency": {
-        "name": "Today's Self Sufficiency",
-        "unit": PERCENTAGE,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "disabled_by_default": True,
-        "accuracy_warning": True,
-        "icon": "mdi:clock-check-outline",
-    },
+    "status.today.gridConsumption": SensorDescription(
+        name="Today's Grid Consumption",
+        unit=UnitOfPower.WATT,
+        device_class="power",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        disabled_by_default=True,
+        accuracy_warning=True,
+    ),
+    "status.today.photovoltaicProduction": SensorDescription(
+        name="Today's PV Production",
+        unit=UnitOfPower.WATT,
+        device_class="power",
+        entity_category=None,
+        pv_related=True,
+        accuracy_warning=True,
+    ),
+    "status.today.selfConsumption": SensorDescription(
+        name="Today's Self Consumption",
+        unit=PERCENTAGE,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        disabled_by_default=True,
+        accuracy_warning=True,
+        icon="mdi:clock-outline",
+    ),
+    "status.today.selfSufficiency": SensorDescription(
+        name="Today's Self Sufficiency",
+        unit=PERCENTAGE,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        disabled_by_default=True,
+        accuracy_warning=True,
+        icon="mdi:clock-check-outline",
+    ),
     # device endpoint
-    "device.firmwareVersion": {
-        "name": "Firmware Version",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:chip",
-    },
-    "device.inverterFirmwareVersion": {
-        "name": "Inverter Firmware Version",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:chip",
-    },
-    "device.bmsFirmwareVersion": {
-        "name": "BMS Firmware Version",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:chip",
-    },
-    "device.energySavingMode.houseConsumptionThreshold": {
-        "name": "House Consumption Threshold",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "device.inverterManufacturer": {
-        "name": "Inverter Manufacturer",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:factory",
-    },
-    "device.inverterModelName": {
-        "name": "Inverter Model Name",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:identifier",
-    },
-    "device.inverterVaRating": {
-        "name": "Inverter VA Rating",
-        "unit": "VA",
-        "device_class": "apparent_power",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "device.inverterSerialNumber": {
-        "name": "Inverter Serial Number",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:barcode",
-    },
-    "device.inverterNominalVpv": {
-        "name": "Inverter Nominal VPV",
-        "unit": "V",
-        "device_class": "voltage",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "pv_related": True,
-    },
-    "device.bmsCapacity": {
-        "name": "BMS Capacity",
-        "unit": "kWh",
-        "device_class": "energy_storage",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "device.bmsSerialNumber": {
-        "name": "BMS Serial Number",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:barcode",
-    },
-    "device.bmsModel": {
-        "name": "BMS Model",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:identifier",
-    },
-    "device.bundleVersion": {
-        "name": "Bundle Version",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:package-variant",
-    },
-    "device.localPortalRemoteId": {
-        "name": "Local Portal Remote ID",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:remote-desktop",
-    },
-    "device.dns": {
-        "name": "DNS Server",
-        "unit": None,
-        "device_class": None,
-        "disabled_by_default": True,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:dns",
-    },
-    "device.timezone.name": {
-        "name": "Device Timezone",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:earth",
-    },
+    "device.firmwareVersion": SensorDescription(
+        name="Firmware Version",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:chip",
+    ),
+    "device.inverterFirmwareVersion": SensorDescription(
+        name="Inverter Firmware Version",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:chip",
+    ),
+    "device.bmsFirmwareVersion": SensorDescription(
+        name="BMS Firmware Version",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:chip",
+    ),
+    "device.energySavingMode.houseConsumptionThreshold": SensorDescription(
+        name="House Consumption Threshold",
+        unit=UnitOfPower.WATT,
+        device_class="power",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "device.inverterManufacturer": SensorDescription(
+        name="Inverter Manufacturer",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:factory",
+    ),
+    "device.inverterModelName": SensorDescription(
+        name="Inverter Model Name",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:identifier",
+    ),
+    "device.inverterVaRating": SensorDescription(
+        name="Inverter VA Rating",
+        unit="VA",
+        device_class="apparent_power",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "device.inverterSerialNumber": SensorDescription(
+        name="Inverter Serial Number",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:barcode",
+    ),
+    "device.inverterNominalVpv": SensorDescription(
+        name="Inverter Nominal VPV",
+        unit="V",
+        device_class="voltage",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        pv_related=True,
+    ),
+    "device.bmsCapacity": SensorDescription(
+        name="BMS Capacity",
+        unit="kWh",
+        device_class="energy_storage",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "device.bmsSerialNumber": SensorDescription(
+        name="BMS Serial Number",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:barcode",
+    ),
+    "device.bmsModel": SensorDescription(
+        name="BMS Model",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:identifier",
+    ),
+    "device.bundleVersion": SensorDescription(
+        name="Bundle Version",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:package-variant",
+    ),
+    "device.localPortalRemoteId": SensorDescription(
+        name="Local Portal Remote ID",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:remote-desktop",
+    ),
+    "device.dns": SensorDescription(
+        name="DNS Server",
+        unit=None,
+        device_class=None,
+        disabled_by_default=True,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:dns",
+    ),
+    "device.timezone.name": SensorDescription(
+        name="Device Timezone",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:earth",
+    ),
     # technical status endpoint - requires technician account
-    "technical_status.operationMode": {
-        "name": "Technical Operation Mode",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:cog-outline",
-    },
-    "technical_status.gridVoltage": {
-        "name": "Grid Voltage",
-        "unit": "V",
-        "device_class": "voltage",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.gridFrequency": {
-        "name": "Grid Frequency",
-        "unit": "Hz",
-        "device_class": "frequency",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.currentToGrid": {
-        "name": "Current To Grid",
-        "unit": "A",
-        "device_class": "current",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.inverterPower": {
-        "name": "Inverter Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.inverterTemperature": {
-        "name": "Inverter Temperature",
-        "unit": "°C",
-        "device_class": "temperature",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.busVoltage": {
-        "name": "Bus Voltage",
-        "unit": "V",
-        "device_class": "voltage",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.gridCode": {
-        "name": "Grid Code",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:code-tags",
-    },
-    "technical_status.dcCurrentInjectionR": {
-        "name": "DC Current Injection R",
-        "unit": "A",
-        "device_class": "current",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "pv_related": True,
-    },
-    "technical_status.dcCurrentInjectionS": {
-        "name": "DC Current Injection S",
-        "unit": "A",
-        "device_class": "current",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "pv_related": True,
-    },
-    "technical_status.dcCurrentInjectionT": {
-        "name": "DC Current Injection T",
-        "unit": "A",
-        "device_class": "current",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "pv_related": True,
-    },
-    "technical_status.inverterModel": {
-        "name": "Technical Inverter Model",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:identifier",
-    },
-    "technical_status.inverterPowerRating": {
-        "name": "Technical Inverter Power Rating",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.pv1Voltage": {
-        "name": "PV1 Voltage",
-        "unit": "V",
-        "device_class": "voltage",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "pv_related": True,
-    },
-    "technical_status.pv1Current": {
-        "name": "PV1 Current",
-        "unit": "A",
-        "device_class": "current",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "pv_related": True,
-    },
-    "technical_status.pv2Voltage": {
-        "name": "PV2 Voltage",
-        "unit": "V",
-        "device_class": "voltage",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "pv_related": True,
-    },
-    "technical_status.pv2Current": {
-        "name": "PV2 Current",
-        "unit": "A",
-        "device_class": "current",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "pv_related": True,
-    },
-    "technical_status.bmsVoltage": {
-        "name": "BMS Voltage",
-        "unit": "V",
-        "device_class": "voltage",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.bmsCurrent": {
-        "name": "BMS Current",
-        "unit": "A",
-        "device_class": "current",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.bmsTemperature": {
-        "name": "BMS Temperature",
-        "unit": "°C",
-        "device_class": "temperature",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.bmsAvgTemperature": {
-        "name": "BMS Average Temperature",
-        "unit": "°C",
-        "device_class": "temperature",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.bmsMaxTemperature": {
-        "name": "BMS Max Temperature",
-        "unit": "°C",
-        "device_class": "temperature",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.bmsMinTemperature": {
-        "name": "BMS Min Temperature",
-        "unit": "°C",
-        "device_class": "temperature",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.bmsTotalCharge": {
-        "name": "BMS Total Charge",
-        "unit": "kWh",
-        "device_class": "energy",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.bmsTotalDischarge": {
-        "name": "BMS Total Discharge",
-        "unit": "kWh",
-        "device_class": "energy",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.bmsStateOfCharge": {
-        "name": "Technical BMS State of Charge",
-        "unit": PERCENTAGE,
-        "device_class": "battery",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.bmsState": {
-        "name": "BMS State",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:battery",
-    },
-    "technical_status.bmsFaultCode": {
-        "name": "BMS Fault Code",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:alert-circle-outline",
-    },
-    "technical_status.bmsHighestCellVoltage": {
-        "name": "BMS Highest Cell Voltage",
-        "unit": "mV",
-        "device_class": "voltage",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.bmsLowestCellVoltage": {
-        "name": "BMS Lowest Cell Voltage",
-        "unit": "mV",
-        "device_class": "voltage",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.bmsCellVoltageDelta": {
-        "name": "BMS Cell Voltage Delta",
-        "unit": "mV",
-        "device_class": "voltage",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "technical_status.tidaProtocolVersion": {
-        "name": "TIDA Protocol Version",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:protocol",
-    },
-    "technical_status.invBootloaderVersion": {
-        "name": "Inverter Bootloader Version",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:chip",
-    },
+    "technical_status.operationMode": SensorDescription(
+        name="Technical Operation Mode",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:cog-outline",
+    ),
+    "technical_status.gridVoltage": SensorDescription(
+        name="Grid Voltage",
+        unit="V",
+        device_class="voltage",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.gridFrequency": SensorDescription(
+        name="Grid Frequency",
+        unit="Hz",
+        device_class="frequency",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.currentToGrid": SensorDescription(
+        name="Current To Grid",
+        unit="A",
+        device_class="current",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.inverterPower": SensorDescription(
+        name="Inverter Power",
+        unit=UnitOfPower.WATT,
+        device_class="power",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.inverterTemperature": SensorDescription(
+        name="Inverter Temperature",
+        unit="°C",
+        device_class="temperature",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.busVoltage": SensorDescription(
+        name="Bus Voltage",
+        unit="V",
+        device_class="voltage",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.gridCode": SensorDescription(
+        name="Grid Code",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:code-tags",
+    ),
+    "technical_status.dcCurrentInjectionR": SensorDescription(
+        name="DC Current Injection R",
+        unit="A",
+        device_class="current",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        pv_related=True,
+    ),
+    "technical_status.dcCurrentInjectionS": SensorDescription(
+        name="DC Current Injection S",
+        unit="A",
+        device_class="current",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        pv_related=True,
+    ),
+    "technical_status.dcCurrentInjectionT": SensorDescription(
+        name="DC Current Injection T",
+        unit="A",
+        device_class="current",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        pv_related=True,
+    ),
+    "technical_status.inverterModel": SensorDescription(
+        name="Technical Inverter Model",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:identifier",
+    ),
+    "technical_status.inverterPowerRating": SensorDescription(
+        name="Technical Inverter Power Rating",
+        unit=UnitOfPower.WATT,
+        device_class="power",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.pv1Voltage": SensorDescription(
+        name="PV1 Voltage",
+        unit="V",
+        device_class="voltage",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        pv_related=True,
+    ),
+    "technical_status.pv1Current": SensorDescription(
+        name="PV1 Current",
+        unit="A",
+        device_class="current",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        pv_related=True,
+    ),
+    "technical_status.pv2Voltage": SensorDescription(
+        name="PV2 Voltage",
+        unit="V",
+        device_class="voltage",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        pv_related=True,
+    ),
+    "technical_status.pv2Current": SensorDescription(
+        name="PV2 Current",
+        unit="A",
+        device_class="current",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        pv_related=True,
+    ),
+    "technical_status.bmsVoltage": SensorDescription(
+        name="BMS Voltage",
+        unit="V",
+        device_class="voltage",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.bmsCurrent": SensorDescription(
+        name="BMS Current",
+        unit="A",
+        device_class="current",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.bmsTemperature": SensorDescription(
+        name="BMS Temperature",
+        unit="°C",
+        device_class="temperature",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.bmsAvgTemperature": SensorDescription(
+        name="BMS Average Temperature",
+        unit="°C",
+        device_class="temperature",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.bmsMaxTemperature": SensorDescription(
+        name="BMS Max Temperature",
+        unit="°C",
+        device_class="temperature",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.bmsMinTemperature": SensorDescription(
+        name="BMS Min Temperature",
+        unit="°C",
+        device_class="temperature",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.bmsTotalCharge": SensorDescription(
+        name="BMS Total Charge",
+        unit="kWh",
+        device_class="energy",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.bmsTotalDischarge": SensorDescription(
+        name="BMS Total Discharge",
+        unit="kWh",
+        device_class="energy",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.bmsStateOfCharge": SensorDescription(
+        name="Technical BMS State of Charge",
+        unit=PERCENTAGE,
+        device_class="battery",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.bmsState": SensorDescription(
+        name="BMS State",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:battery",
+    ),
+    "technical_status.bmsFaultCode": SensorDescription(
+        name="BMS Fault Code",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:alert-circle-outline",
+    ),
+    "technical_status.bmsHighestCellVoltage": SensorDescription(
+        name="BMS Highest Cell Voltage",
+        unit="mV",
+        device_class="voltage",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.bmsLowestCellVoltage": SensorDescription(
+        name="BMS Lowest Cell Voltage",
+        unit="mV",
+        device_class="voltage",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.bmsCellVoltageDelta": SensorDescription(
+        name="BMS Cell Voltage Delta",
+        unit="mV",
+        device_class="voltage",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "technical_status.tidaProtocolVersion": SensorDescription(
+        name="TIDA Protocol Version",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:protocol",
+        # Rarely useful
+        disabled_by_default=True,
+    ),
+    "technical_status.invBootloaderVersion": SensorDescription(
+        name="Inverter Bootloader Version",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:chip",
+    ),
     # maintenance diagnostics endpoint - requires technician account
-    "maintenance_diagnostics.ramUsage.total": {
-        "name": "System RAM Total",
-        "unit": "MB",
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:memory",
-    },
-    "maintenance_diagnostics.ramUsage.used": {
-        "name": "System RAM Used",
-        "unit": "MB",
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:memory",
-    },
-    "maintenance_diagnostics.cpuUsage.used": {
-        "name": "System CPU Usage",
-        "unit": PERCENTAGE,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:cpu-64-bit",
-    },
+    "maintenance_diagnostics.ramUsage.total": SensorDescription(
+        name="System RAM Total",
+        unit="MB",
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:memory",
+    ),
+    "maintenance_diagnostics.ramUsage.used": SensorDescription(
+        name="System RAM Used",
+        unit="MB",
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:memory",
+    ),
+    "maintenance_diagnostics.cpuUsage.used": SensorDescription(
+        name="System CPU Usage",
+        unit=PERCENTAGE,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:cpu-64-bit",
+    ),
     # notification endpoints
-    "unread_notifications_count.total": {
-        "name": "Unread Notifications Count",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:bell-badge-outline",
-    },
-    "notifications.total": {
-        "name": "Total Notifications Count",
-        "unit": None,
-        "device_class": None,
-        "entity_category": EntityCategory.DIAGNOSTIC,
-        "icon": "mdi:bell-outline",
-    },
+    "unread_notifications_count.total": SensorDescription(
+        name="Unread Notifications Count",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:bell-badge-outline",
+    ),
+    "notifications.total": SensorDescription(
+        name="Total Notifications Count",
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:bell-outline",
+    ),
+}
+
+# Sensors created for systems without PV
+NON_PV_SENSOR_TYPES: dict[str, SensorDescription] = {
+    key: description
+    for key, description in SENSOR_TYPES.items()
+    if not description.pv_related
 }
 
 
 async def async_setup_entry(
-    _hass: HomeAssistant,
+    hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Eaton xStorage Home sensor platform."""
-    from .const import TECHNICIAN_ONLY_SENSORS
-
     coordinator: EatonXstorageHomeCoordinator = config_entry.runtime_data
     has_pv = config_entry.data.get("has_pv", False)
     user_type = config_entry.data.get(
@@ -704,18 +738,26 @@ async def async_setup_entry(
     )  # Default to tech for backward compatibility
     is_technician = user_type == "tech"
 
-    # Create sensors based on account type and PV configuration
-    entities: list[EatonXStorageSensor | EatonXStorageNotificationsSensor] = []
-    for key, description in SENSOR_TYPES.items():
-        # Skip PV-related sensors if has_pv is False
-        if description.get("pv_related", False) and not has_pv:
-            continue
-
-        # Skip technician-only sensors for customer accounts
-        if key in TECHNICIAN_ONLY_SENSORS and not is_technician:
-            continue
+    # Sensors disabled in the entity registry are never added to Home
+    # Assistant; enabling one reloads the entry, which creates it again
+    entity_registry = er.async_get(hass)
+    disabled_unique_ids = {
+        entry.unique_id
+        for entry in er.async_entries_for_config_entry(
+            entity_registry, config_entry.entry_id
+        )
+        if entry.domain == "sensor" and entry.disabled_by is not None
+    }
 
-        entities.append(EatonXStorageSensor(coordinator, key, description, has_pv))
+    # Create sensors based on account type and PV configuration, skipping
+    # PV-related sensors without PV and technician-only sensors for customers
+    sensor_types = SENSOR_TYPES if has_pv else NON_PV_SENSOR_TYPES
+    entities: list[EatonXStorageSensor | EatonXStorageNotificationsSensor] = [
+        EatonXStorageSensor(coordinator, key, description, has_pv)
+        for key, description in sensor_types.items()
+        if (is_technician or key not in TECHNICIAN_ONLY_SENSORS)
+        and sensor_unique_id(key) not in disabled_unique_ids
+    ]
 
     # Add the notifications array sensor
     entities.append(EatonXStorageNotificationsSensor(coordinator))
@@ -723,11 +765,219 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
+def sensor_unique_id(key: str) -> str:
+    """Return the unique ID of the sensor for a data key."""
+    return f"eaton_xstorage_{key.replace('.', '_')}"
+
+
+def _compute_bms_cell_voltage_delta(
+    data: dict[str, Any], log_error: Callable[..., None]
+) -> int | float | None:
+    """Calculate the BMS cell voltage delta from the highest and lowest cell.
+
+    Invalid cell voltages are reported through the sensor's log_error.
+    """
+    tech_status = data.get("technical_status") or _EMPTY
+    highest = tech_status.get("bmsHighestCellVoltage")
+    lowest = tech_status.get("bmsLowestCellVoltage")
+    if not isinstance(highest, (int, float)) or not isinstance(lowest, (int, float)):
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Delta calculation failed - missing values. Highest: %s, Lowest: %s",
+                highest,
+                lowest,
+            )
+        return None
+
+    # Filter out values below 1000mV before calculation
+    if highest < 1000:
+        log_error(
+            "BMS highest cell voltage below 1000mV threshold: %smV - delta calculation not possible",
+            highest,
+        )
+        return None
+    if lowest < 1000:
+        log_error(
+            "BMS lowest cell voltage below 1000mV threshold: %smV - delta calculation not possible",
+            lowest,
+        )
+        return None
+
+    # Cell voltages are usually whole millivolts, which need no rounding
+    delta = highest - lowest
+    return delta if type(delta) is int else round(delta, 1)
+
+
+# BMS cell voltage sensors whose values below 1000mV are errors
+CELL_VOLTAGE_SENSORS = frozenset(
+    {
+        "technical_status.bmsHighestCellVoltage",
+        "technical_status.bmsLowestCellVoltage",
+    }
+)
+
+# Technical sensors that sometimes incorrectly return 0: BMS temperatures,
+# charge/discharge totals, bmsVoltage and gridFrequency
+ZERO_INVALID_SENSORS = frozenset(
+    {
+        "technical_status.bmsMaxTemperature",
+        "technical_status.bmsMinTemperature",
+        "technical_status.bmsAvgTemperature",
+        "technical_status.bmsTotalCharge",
+        "technical_status.bmsTotalDischarge",
+        "technical_status.bmsVoltage",
+        "technical_status.gridFrequency",
+    }
+)
+
+# Maps translating raw mode and state codes to human-readable values;
+# Battery Status uses the same mapping as BMS State
+VALUE_MAPS: dict[str, dict[str, str]] = {
+    "status.currentMode.command": CURRENT_MODE_COMMAND_MAP,
+    "status.currentMode.parameters.action": CURRENT_MODE_ACTION_MAP,
+    "status.currentMode.type": CURRENT_MODE_TYPE_MAP,
+    "status.currentMode.recurrence": CURRENT_MODE_RECURRENCE_MAP,
+    "status.energyFlow.operationMode": OPERATION_MODE_MAP,
+    "technical_status.operationMode": OPERATION_MODE_MAP,
+    "technical_status.bmsState": BMS_STATE_MAP,
+    "status.energyFlow.batteryStatus": BMS_STATE_MAP,
+}
+
+# Marker for a raw value that has not been formatted yet
+_UNSET = object()
+
+# Exact power of two, so multiplying matches dividing by 1024 twice
+MEGABYTES_PER_BYTE = 1 / (1024 * 1024)
+
+
+def _map_value(value_map: dict[str, str], value: Any) -> Any:
+    """Translate a raw mode or state code to a human-readable value."""
+    if isinstance(value, str):
+        return value_map.get(value, value)
+    return value
+
+
+def _format_temperature(value: Any) -> Any:
+    """Round temperature values to 1 decimal place."""
+    if isinstance(value, (int, float)):
+        return round(value, 1)
+    return value
+
+
+def _format_time(value: Any) -> Any:
+    """Format startTime and endTime values to 12-hour format."""
+    # Accept both int and string representations
+    if not isinstance(value, int) and not (isinstance(value, str) and value.isdigit()):
+        return value
+    try:
+        hour, minute = divmod(int(value), 100)
+    except ValueError:
+        return value
+    if 0 <= hour < 24 and 0 <= minute < 60:
+        suffix = " am" if hour < 12 else " pm"
+        return f"{hour % 12 or 12}:{minute:02d}{suffix}"
+    return value
+
+
+def _format_ram(value: Any) -> Any:
+    """Convert RAM usage from bytes to megabytes."""
+    if isinstance(value, (int, float)):
+        return round(value * MEGABYTES_PER_BYTE, 2)
+    return value
+
+
+def _format_cpu(value: Any) -> Any:
+    """Round CPU usage to 2 decimal places."""
+    if isinstance(value, (int, float)):
+        return round(value, 2)
+    return value
+
+
+def _value_transform(key: str, device_class: str | None) -> Callable[[Any], Any] | None:
+    """Return the transform for a sensor's values, or None to pass them through."""
+    value_map = VALUE_MAPS.get(key)
+    if value_map is not None:
+        return partial(_map_value, value_map)
+    if device_class == "temperature":
+        return _format_temperature
+    if key.endswith(("startTime", "endTime")):
+        return _format_time
+    if "ramUsage" in key:
+        return _format_ram
+    if "cpuUsage.used" in key:
+        return _format_cpu
+    return None
+
+
+def _display_precision(key: str, description: SensorDescription) -> int | None:
+    """Return the suggested number of decimal places for display."""
+    # Use sensor-specific precision if defined
+    if description.precision is not None:
+        return description.precision
+
+    device_class = description.device_class
+    # Temperature sensors: 1 decimal place
+    if device_class in ("temperature", "voltage"):
+        return 1
+    # Current sensors: 2 decimal places
+    if device_class in ("current", "frequency"):
+        return 2
+    # Power sensors: 0 decimal places (whole watts)
+    if device_class == "power":
+        return 0
+    # Energy sensors: 1 decimal place
+    if device_class in ("energy", "energy_storage"):
+        return 1
+    # Apparent power (VA): 0 decimal places
+    if (
+        device_class == "apparent_power"
+        or description.unit == PERCENTAGE
+        or "ramUsage" in key
+    ):
+        return 0
+    # CPU usage: 1 decimal place
+    if "cpuUsage" in key:
+        return 1
+    # Cell voltage sensors (mV): 0 decimal places (already in millivolts)
+    if "CellVoltage" in key or "VoltageDelta" in key:
+        return 0
+    # Default: no specific precision
+    return None
+
+
+type ComputeFn = Callable[[dict[str, Any], Callable[..., None]], int | float | None]
+
+# Sensors whose value is calculated instead of read from the data
+COMPUTED_SENSORS: dict[str, ComputeFn] = {
+    "technical_status.bmsCellVoltageDelta": _compute_bms_cell_voltage_delta,
+}
+
+
+# Extra state attributes for sensors with accuracy warnings
+ACCURACY_WARNING_ATTRIBUTES: dict[str, str] = {
+    "accuracy_warning": POWER_ACCURACY_WARNING,
+    "measurement_note": "Values typically 10%-30% higher than actual",
+}
+
+# Notification attribute names and the API fields they are read from
+NOTIFICATION_FIELDS: tuple[tuple[str, str], ...] = (
+    ("alert_id", "alertId"),
+    ("level", "level"),
+    ("type", "type"),
+    ("sub_type", "subType"),
+    ("status", "status"),
+    ("created_at", "createdAt"),
+    ("updated_at", "updatedAt"),
+)
+
+
 class EatonXStorageNotificationsSensor(
     CoordinatorEntity[EatonXstorageHomeCoordinator], SensorEntity
 ):
     """Sensor for displaying notifications array."""
 
+    __slots__ = ("_attrs_source", "_attrs")
+
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Notifications"
@@ -736,54 +986,51 @@ class EatonXStorageNotificationsSensor(
     def __init__(self, coordinator: EatonXstorageHomeCoordinator) -> None:
         """Initialize the notifications sensor."""
         super().__init__(coordinator)
+        self._attr_device_info = coordinator.device_info
+        # Formatted attributes and the notifications payload they were built
+        # from; each refresh delivers a new payload object
+        self._attrs_source: Any = None
+        self._attrs: dict[str, Any] = {}
 
     @property
     def native_value(self) -> int:
         """Return the number of notifications as the state."""
-        try:
-            notifications_data = self.coordinator.data.get("notifications", {})
-            results = notifications_data.get("results", [])
-            return len(results)
-        except (KeyError, TypeError, AttributeError) as err:
-            _LOGGER.error("Error retrieving notifications state: %s", err)
-            return 0
+        return len(self._results(self._notifications()))
 
     @property
-    def extra_state_attributes(self):
+    def extra_state_attributes(self) -> dict[str, Any]:
         """Return notifications as attributes."""
-        try:
-            notifications_data = self.coordinator.data.get("notifications", {})
-            results = notifications_data.get("results", [])
-
-            # Format notifications for better readability
-            formatted_notifications = []
-            for notification in results:
-                formatted_notifications.append(
-                    {
-                        "alert_id": notification.get("alertId"),
-                        "level": notification.get("level"),
-                        "type": notification.get("type"),
-                        "sub_type": notification.get("subType"),
-                        "status": notification.get("status"),
-                        "created_at": notification.get("createdAt"),
-                        "updated_at": notification.get("updatedAt"),
-                    }
-                )
-
-            return {
-                "notifications": formatted_notifications,
-                "total": notifications_data.get("total", 0),
-                "start": notifications_data.get("start", 0),
-                "size": notifications_data.get("size", 0),
-            }
-        except (KeyError, TypeError, AttributeError) as e:
-            _LOGGER.error("Error retrieving notifications attributes: %s", e)
-            return {}
+        notifications_data = self._notifications()
+        if notifications_data is self._attrs_source:
+            return self._attrs
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        return self.coordinator.device_info
+        # Format notifications for better readability
+        formatted_notifications = [
+            {attr: notification.get(field) for attr, field in NOTIFICATION_FIELDS}
+            for notification in self._results(notifications_data)
+            if isinstance(notification, dict)
+        ]
+
+        self._attrs = {
+            "notifications": formatted_notifications,
+            "total": notifications_data.get("total", 0),
+            "start": notifications_data.get("start", 0),
+            "size": notifications_data.get("size", 0),
+        }
+        self._attrs_source = notifications_data
+        return self._attrs
+
+    def _notifications(self) -> Mapping[str, Any]:
+        """Return the notifications payload, or an empty mapping if missing."""
+        data = self.coordinator.data
+        notifications_data = data.get("notifications") if data else None
+        return notifications_data if isinstance(notifications_data, dict) else _EMPTY
+
+    @staticmethod
+    def _results(notifications_data: Mapping[str, Any]) -> Sequence[Any]:
+        """Return the notification list of a payload."""
+        results = notifications_data.get("results")
+        return results if isinstance(results, list) else ()
 
 
 class EatonXStorageSensor(
@@ -791,33 +1038,62 @@ class EatonXStorageSensor(
 ):
     """Eaton xStorage Home sensor entity."""
 
+    __slots__ = (
+        "_key",
+        "_key_path",
+        "_is_technical",
+        "_compute",
+        "_filter_low_cell_voltage",
+        "_filter_zero",
+        "_transform",
+        "_accuracy_warning",
+        "_last_written",
+        "_cached_raw",
+        "_cached_value",
+        "_voltage_error_logged_at",
+    )
+
     _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: EatonXstorageHomeCoordinator,
         key: str,
-        description: dict[str, Any],
+        description: SensorDescription,
         _has_pv: bool,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._key = key
-        # Be robust to missing fields in description
-        self._attr_name = description.get("name", key)
-        self._attr_native_unit_of_measurement = description.get("unit")
-        self._attr_device_class = description.get("device_class")
-        self._attr_entity_category = description.get("entity_category")
-        self._attr_entity_registry_enabled_default = not description.get(
-            "disabled_by_default", False
-        )
-        self._accuracy_warning = description.get("accuracy_warning", False)
-        self._precision = description.get("precision")
-        self._attr_unique_id = f"eaton_xstorage_{key.replace('.', '_')}"
+        self._key_path = tuple(key.split("."))
+        self._is_technical = self._key_path[0] == "technical_status"
+        self._compute = COMPUTED_SENSORS.get(key)
+        self._filter_low_cell_voltage = key in CELL_VOLTAGE_SENSORS
+        self._filter_zero = key in ZERO_INVALID_SENSORS
+        self._attr_name = description.name
+        self._attr_native_unit_of_measurement = description.unit
+        self._attr_device_class = description.device_class
+        self._transform = _value_transform(key, description.device_class)
+        self._attr_entity_category = description.entity_category
+        # Disable entities marked with disabled_by_default flag (e.g., 30-day metrics)
+        self._attr_entity_registry_enabled_default = not description.disabled_by_default
+        self._accuracy_warning = description.accuracy_warning
+        if description.accuracy_warning:
+            self._attr_extra_state_attributes = ACCURACY_WARNING_ATTRIBUTES
+        self._attr_suggested_display_precision = _display_precision(key, description)
+        self._attr_unique_id = sensor_unique_id(key)
+        self._attr_device_info = coordinator.device_info
+        # (available, native_value) as of the last state write
+        self._last_written: tuple[bool, str | int | float | None] | None = None
+        # Last raw value and the native value formatted from it
+        self._cached_raw: Any = _UNSET
+        self._cached_value: str | int | float | None = None
+        # Monotonic time of the last BMS cell voltage error logged
+        self._voltage_error_logged_at: float | None = None
 
         # Apply icon from description if provided
-        if description.get("icon"):
-            self._attr_icon = description["icon"]
+        if description.icon:
+            self._attr_icon = description.icon
 
         # Set state_class for power and energy sensors
         if self._attr_device_class == "power":
@@ -827,254 +1103,99 @@ class EatonXStorageSensor(
         elif self._attr_device_class == "energy_storage":
             self._attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Return if the entity should be enabled when first added."""
-        # Disable TIDA Protocol Version by default as it's rarely useful
-        if self._key == "technical_status.tidaProtocolVersion":
-            return False
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the sensor value or availability changed."""
+        current = (self.available, self.native_value)
+        if current == self._last_written:
+            return
+        self._last_written = current
+        self.async_write_ha_state()
 
-        # Disable entities marked with disabled_by_default flag (e.g., 30-day metrics)
-        return self._attr_entity_registry_enabled_default
+    def _log_voltage_error(self, msg: str, *args: Any) -> None:
+        """Log a BMS cell voltage error at most once per interval.
 
-    @property
-    def native_value(self) -> str | int | float | None:
-        try:
-            # Log accuracy warning for sensors with known accuracy issues
-            if self._accuracy_warning:
-                _LOGGER.debug(
-                    "Sensor %s (%s) - %s",
-                    self._attr_name,
-                    self._key,
-                    POWER_ACCURACY_WARNING,
-                )
-
-            # Calculate BMS cell voltage delta first (before normal data extraction)
-            if self._key == "technical_status.bmsCellVoltageDelta":
-                try:
-                    tech_status = self.coordinator.data.get("technical_status", {})
-                    highest = tech_status.get("bmsHighestCellVoltage")
-                    lowest = tech_status.get("bmsLowestCellVoltage")
-
-                    # Filter out values below 1000mV before calculation
-                    if highest is not None and highest < 1000:
-                        _LOGGER.error(
-                            "BMS highest cell voltage below 1000mV threshold: %smV - delta calculation not possible",
-                            highest,
-                        )
-                        return None
-                    if lowest is not None and lowest < 1000:
-                        _LOGGER.error(
-                            "BMS lowest cell voltage below 1000mV threshold: %smV - delta calculation not possible",
-                            lowest,
-                        )
-                        return None
-
-                    if highest is not None and lowest is not None:
-                        delta = float(highest) - float(lowest)
-                        result = round(delta, 1)
-                        return result
-                    _LOGGER.debug(
-                        "Delta calculation failed - missing values. Highest: %s, Lowest: %s",
-                        highest,
-                        lowest,
-                    )
-                    return None
-                except (ValueError, TypeError) as e:
-                    _LOGGER.error("Error calculating BMS cell voltage delta: %s", e)
-                    return None
-
-            # Normal data extraction for other sensors
-            keys = self._key.split(".")
-            value = self.coordinator.data
-            for k in keys:
-                value = value.get(k, {}) if isinstance(value, dict) else {}
-            # If value is still a dict, return None
-            if isinstance(value, dict):
-                return None
+        A faulty BMS keeps reporting the same invalid value on every update.
+        """
+        now = time.monotonic()
+        last = self._voltage_error_logged_at
+        if last is not None and now - last < VOLTAGE_ERROR_LOG_INTERVAL:
+            return
+        self._voltage_error_logged_at = now
+        _LOGGER.error(msg, *args)
 
-            # Handle null/None values that should display as "None" instead of "Unknown"
-            if value is None:
+    def _raw_value(self) -> Any:
+        """Return the raw value for the sensor key, or None if it is missing."""
+        # Coordinator data is plain JSON, so an exact type check suffices
+        value = self.coordinator.data
+        for part in self._key_path:
+            if type(value) is not dict:
                 return None
+            value = value.get(part)
+        # Objects are not valid sensor states
+        if type(value) is dict:
+            return None
+        return value
 
-            # Debug logging for technical status sensors to help troubleshoot formatting issues
-            if self._key.startswith("technical_status.") and value is not None:
-                _LOGGER.debug(
-                    "Technical Status Sensor '%s' - Raw value: '%s' (type: %s)",
-                    self._key,
-                    value,
-                    type(value).__name__,
-                )
-
-            # Filter out values below 1000mV for BMS cell voltage sensors
-            if (
-                self._key
-                in [
-                    "technical_status.bmsHighestCellVoltage",
-                    "technical_status.bmsLowestCellVoltage",
-                ]
-                and isinstance(value, (int, float))
-                and value < 1000
-            ):
-                _LOGGER.error(
-                    "BMS cell voltage %s below 1000mV threshold: %smV - treating as error",
-                    self._key,
-                    value,
-                )
-                return None
+    @property
+    def native_value(self) -> str | int | float | None:
+        # Log accuracy warning for sensors with known accuracy issues
+        if self._accuracy_warning and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Sensor %s (%s) - %s",
+                self._attr_name,
+                self._key,
+                POWER_ACCURACY_WARNING,
+            )
 
-            # Filter out invalid 0 values for certain technical sensors that sometimes incorrectly return 0
-            # Existing (BMS temps and charge/discharge) + additional: bmsAvgTemperature, bmsVoltage, gridFrequency
-            if (
-                self._key
-                in [
-                    "technical_status.bmsMaxTemperature",
-                    "technical_status.bmsMinTemperature",
-                    "technical_status.bmsAvgTemperature",
-                    "technical_status.bmsTotalCharge",
-                    "technical_status.bmsTotalDischarge",
-                    "technical_status.bmsVoltage",
-                    "technical_status.gridFrequency",
-                ]
-                and isinstance(value, (int, float))
-                and value == 0
-            ):
-                _LOGGER.debug(
-                    "Sensor %s returned invalid value 0 - ignoring",
-                    self._key,
-                )
-                return None
+        # Derived sensors are calculated from other values
+        if self._compute is not None:
+            return self._compute(self.coordinator.data, self._log_voltage_error)
 
-            # Format Current Mode Command to human-readable format
-            if self._key == "status.currentMode.command" and isinstance(value, str):
-                return CURRENT_MODE_COMMAND_MAP.get(value, value)
-
-            # Format Current Mode Action to human-readable format
-            if self._key == "status.currentMode.parameters.action" and isinstance(
-                value, str
-            ):
-                return CURRENT_MODE_ACTION_MAP.get(value, value)
-
-            # Format Current Mode Type to human-readable format
-            if self._key == "status.currentMode.type" and isinstance(value, str):
-                return CURRENT_MODE_TYPE_MAP.get(value, value)
-
-            # Format Current Mode Recurrence to human-readable format
-            if self._key == "status.currentMode.recurrence" and isinstance(value, str):
-                return CURRENT_MODE_RECURRENCE_MAP.get(value, value)
-
-            # Format Operation Mode to human-readable format
-            if self._key == "status.energyFlow.operationMode" and isinstance(
-                value, str
-            ):
-                return OPERATION_MODE_MAP.get(value, value)
-
-            # Format Technical Operation Mode to human-readable format
-            if self._key == "technical_status.operationMode" and isinstance(value, str):
-                # Add debug logging to help troubleshoot
-                _LOGGER.debug(
-                    "Technical Operation Mode - Raw value: '%s', Mapped value: '%s'",
-                    value,
-                    OPERATION_MODE_MAP.get(value, value),
-                )
-                return OPERATION_MODE_MAP.get(value, value)
-
-            # Format BMS State to human-readable format
-            if self._key == "technical_status.bmsState" and isinstance(value, str):
-                return BMS_STATE_MAP.get(value, value)
-
-            # Format Battery Status to human-readable format (uses same mapping as BMS State)
-            if self._key == "status.energyFlow.batteryStatus" and isinstance(
-                value, str
-            ):
-                return BMS_STATE_MAP.get(value, value)
-
-            # Round temperature values to 1 decimal place
-            if self._attr_device_class == "temperature" and isinstance(
-                value, (int, float)
-            ):
-                return round(value, 1)
-
-            # Format startTime and endTime to 12-hour format
-            if (self._key.endswith("startTime") or self._key.endswith("endTime")) and (
-                isinstance(value, int) or (isinstance(value, str) and value.isdigit())
-            ):
-                # Accept both int and string representations
-                time_val = int(value)
-                hour = time_val // 100
-                minute = time_val % 100
-                if 0 <= hour < 24 and 0 <= minute < 60:
-                    suffix = " am" if hour < 12 or hour == 24 else " pm"
-                    hour12 = hour % 12
-                    if hour12 == 0:
-                        hour12 = 12
-                    return f"{hour12}:{minute:02d}{suffix}"
-            # Convert RAM usage from bytes to megabytes
-            if "ramUsage" in self._key and isinstance(value, (int, float)):
-                return round(value / 1024 / 1024, 2)
-            # Round CPU usage to 2 decimal places
-            if "cpuUsage.used" in self._key and isinstance(value, (int, float)):
-                return round(value, 2)
-            return value
-        except (KeyError, TypeError, AttributeError, ValueError) as e:
-            _LOGGER.error("Error retrieving state for %s: %s", self._key, e)
+        # Normal data extraction for other sensors
+        value = self._raw_value()
+        if value is None:
             return None
 
-    @property
-    def suggested_display_precision(self) -> int | None:
-        """Return the suggested number of decimal places for display."""
-        # Use sensor-specific precision if defined
-        if self._precision is not None:
-            return self._precision
-
-        # Temperature sensors: 1 decimal place
-        if (
-            self._attr_device_class == "temperature"
-            or self._attr_device_class == "voltage"
-        ):
-            return 1
-        # Current sensors: 2 decimal places
-        if (
-            self._attr_device_class == "current"
-            or self._attr_device_class == "frequency"
-        ):
-            return 2
-        # Power sensors: 0 decimal places (whole watts)
-        if self._attr_device_class == "power":
-            return 0
-        # Energy sensors: 1 decimal place
-        if (
-            self._attr_device_class == "energy"
-            or self._attr_device_class == "energy_storage"
-        ):
-            return 1
-        # Apparent power (VA): 0 decimal places
-        if (
-            self._attr_device_class == "apparent_power"
-            or self._attr_native_unit_of_measurement == PERCENTAGE
-            or "ramUsage" in self._key
-        ):
-            return 0
-        # CPU usage: 1 decimal place
-        if "cpuUsage" in self._key:
-            return 1
-        # Cell voltage sensors (mV): 0 decimal places (already in millivolts)
-        if "CellVoltage" in self._key or "VoltageDelta" in self._key:
-            return 0
-        # Default: no specific precision
-        return None
+        # Filtering and formatting only depend on the raw value
+        cached_raw = self._cached_raw
+        if type(value) is type(cached_raw) and value == cached_raw:
+            return self._cached_value
+        self._cached_value = self._format_value(value)
+        self._cached_raw = value
+        return self._cached_value
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes for entities with accuracy warnings."""
-        if self._accuracy_warning:
-            return {
-                "accuracy_warning": POWER_ACCURACY_WARNING,
-                "measurement_note": "Values typically 10%-30% higher than actual",
-            }
-        return None
+    def _format_value(self, value: Any) -> str | int | float | None:
+        """Filter and format a raw value from the API."""
+        key = self._key
+        # Debug logging for technical status sensors to help troubleshoot formatting issues
+        if self._is_technical and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Technical Status Sensor '%s' - Raw value: '%s' (type: %s)",
+                key,
+                value,
+                type(value).__name__,
+            )
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        return self.coordinator.device_info
+        is_number = isinstance(value, (int, float))
+
+        # Filter out values below 1000mV for BMS cell voltage sensors
+        if self._filter_low_cell_voltage and is_number and value < 1000:
+            self._log_voltage_error(
+                "BMS cell voltage %s below 1000mV threshold: %smV - treating as error",
+                key,
+                value,
+            )
+            return None
+
+        # Filter out invalid 0 values for certain technical sensors that sometimes incorrectly return 0
+        if self._filter_zero and is_number and value == 0:
+            _LOGGER.debug(
+                "Sensor %s returned invalid value 0 - ignoring",
+                key,
+            )
+            return None
+
+        # Translate codes and format values for display
+        transform = self._transform
+        return value if transform is None else transform(value)
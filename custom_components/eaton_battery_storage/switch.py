@@ -8,12 +8,14 @@ from typing import TYPE_CHECKING
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api import is_successful
+
 if TYPE_CHECKING:
     from .coordinator import EatonBatteryStorageCoordinator
 
@@ -21,6 +23,10 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds to wait for a refresh to report a new state after a command; covers
+# the cooldown of the coordinator's refresh debouncer
+STATE_REPORT_TIMEOUT = 10.0
+
 
 async def async_setup_entry(
     _hass: HomeAssistant,
@@ -36,24 +42,51 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
+async def _async_wait_for_report(
+    coordinator: EatonBatteryStorageCoordinator, reported: asyncio.Event
+) -> None:
+    """Request a refresh and wait until the expected state is reported.
+
+    The event is set by the entity's coordinator update handler. Gives up
+    after STATE_REPORT_TIMEOUT seconds.
+    """
+    await coordinator.async_request_refresh()
+    try:
+        await asyncio.wait_for(reported.wait(), STATE_REPORT_TIMEOUT)
+    except asyncio.TimeoutError:
+        _LOGGER.debug("Device did not report the new state in time")
+
+
 class EatonXStoragePowerSwitch(CoordinatorEntity, SwitchEntity):
     """Switch to control the power state of the Eaton xStorage Home device."""
 
+    __slots__ = (
+        "_optimistic_state",
+        "_awaiting_state",
+        "_state_reported",
+        "_command_lock",
+        "_last_written",
+    )
+
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
     _attr_icon = "mdi:power"
+    _attr_unique_id = "eaton_xstorage_inverter_power"
+    _attr_name = "Inverter power"
 
     def __init__(self, coordinator: EatonBatteryStorageCoordinator) -> None:
         """Initialize the power switch."""
         super().__init__(coordinator)
-        self._attr_unique_id = "eaton_xstorage_inverter_power"
-        self._attr_name = "Inverter power"
+        self._attr_device_info = coordinator.device_info
         self._optimistic_state: bool | None = None
-
-    @property
-    def device_info(self) -> dict[str, str]:
-        """Return device information."""
-        return self.coordinator.device_info
+        # Keep the optimistic state while refreshing after a command
+        self._awaiting_state = False
+        # Set when a refresh reports the state a command asked for
+        self._state_reported = asyncio.Event()
+        # Serializes commands so a repeated toggle waits for the first one
+        self._command_lock = asyncio.Lock()
+        # (available, is_on) as of the last state write
+        self._last_written: tuple[bool, bool | None] | None = None
 
     @property
     def is_on(self) -> bool | None:
@@ -62,77 +95,74 @@ class EatonXStoragePowerSwitch(CoordinatorEntity, SwitchEntity):
         if self._optimistic_state is not None:
             return self._optimistic_state
 
-        try:
-            # Otherwise, check the powerState from device data
-            device_data = (
-                self.coordinator.data.get("device", {}) if self.coordinator.data else {}
-            )
-            return device_data.get("powerState", False)
-        except (AttributeError, TypeError, KeyError):
-            return False
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            self.coordinator.last_update_success and self.coordinator.data is not None
-        )
+        # Otherwise, check the powerState from device data
+        return self._reported_power_state()
 
     async def async_turn_on(self, **_kwargs) -> None:
         """Turn the device on."""
-        try:
-            # Set optimistic state immediately for responsive UI
-            self._optimistic_state = True
-            self.async_write_ha_state()
-
-            # Send the command, but don't expect a response
-            await self.coordinator.api.set_device_power(True)
-            _LOGGER.info(
-                "Sent turn ON command to Eaton xStorage Home device (no response expected)"
-            )
-            # Wait a bit for the device to actually change state
-            await asyncio.sleep(3)
-
-            # Always refresh the coordinator data after attempting to change power state
-            await self.coordinator.async_request_refresh()
-
-            # Clear optimistic state so we use real data
-            self._optimistic_state = None
-
-        except Exception as exc:
-            _LOGGER.error("Error turning on device: %s", exc)
-            # Clear optimistic state and refresh to get current state
-            self._optimistic_state = None
-            await self.coordinator.async_request_refresh()
-            raise HomeAssistantError("Failed to turn on device") from exc
+        await self._set_power(True)
 
     async def async_turn_off(self, **_kwargs) -> None:
         """Turn the device off."""
+        await self._set_power(False)
+
+    async def _set_power(self, on: bool) -> None:
+        """Turn the device on or off."""
+        # Already in the requested state, or a pending command will get there
+        if self.is_on == on:
+            return
+        state = "on" if on else "off"
+        async with self._command_lock:
+            # A command that completed while we waited may have done the work
+            if self._reported_power_state() == on:
+                return
+            try:
+                # Set optimistic state immediately for responsive UI
+                self._optimistic_state = on
+                self.async_write_ha_state()
+                self._last_written = (self.available, on)
+
+                # Send the command, but don't expect a response
+                await self.coordinator.api.set_device_power(on)
+                _LOGGER.info(
+                    "Sent turn %s command to Eaton xStorage Home device "
+                    "(no response expected)",
+                    state.upper(),
+                )
+                # Refresh until the device reports the new state
+                await self._wait_for_power_state()
+
+            except Exception as exc:
+                _LOGGER.error("Error turning %s device: %s", state, exc)
+                # Clear optimistic state and refresh to get current state
+                self._clear_optimistic_state()
+                await self.coordinator.async_request_refresh()
+                raise HomeAssistantError(f"Failed to turn {state} device") from exc
+
+    async def _wait_for_power_state(self) -> None:
+        """Refresh the coordinator and wait until it reports the optimistic state.
+
+        Clears the optimistic state afterwards so the reported state is shown
+        even if the device did not confirm the change in time.
+        """
+        self._state_reported.clear()
+        self._awaiting_state = True
         try:
-            # Set optimistic state immediately for responsive UI
-            self._optimistic_state = False
-            self.async_write_ha_state()
-
-            # Send the command, but don't expect a response
-            await self.coordinator.api.set_device_power(False)
-            _LOGGER.info(
-                "Sent turn OFF command to Eaton xStorage Home device (no response expected)"
-            )
-            # Wait a bit for the device to actually change state
-            await asyncio.sleep(3)
-
-            # Always refresh the coordinator data after attempting to change power state
-            await self.coordinator.async_request_refresh()
-
-            # Clear optimistic state so we use real data
-            self._optimistic_state = None
-
-        except Exception as exc:
-            _LOGGER.error("Error turning off device: %s", exc)
-            # Clear optimistic state and refresh to get current state
-            self._optimistic_state = None
-            await self.coordinator.async_request_refresh()
-            raise HomeAssistantError("Failed to turn off device") from exc
+            await _async_wait_for_report(self.coordinator, self._state_reported)
+        finally:
+            self._awaiting_state = False
+        self._clear_optimistic_state()
+
+    def _clear_optimistic_state(self) -> None:
+        """Drop the optimistic state and show the reported state."""
+        self._optimistic_state = None
+        self.async_write_ha_state()
+        self._last_written = (self.available, self.is_on)
+
+    def _reported_power_state(self) -> bool:
+        """Return the power state reported by the device."""
+        data = self.coordinator.data or {}
+        return bool((data.get("device") or {}).get("powerState", False))
 
     def turn_on(self, **kwargs) -> None:
         """Turn the device on (sync wrapper)."""
@@ -142,32 +172,53 @@ class EatonXStoragePowerSwitch(CoordinatorEntity, SwitchEntity):
         """Turn the device off (sync wrapper)."""
         asyncio.create_task(self.async_turn_off(**kwargs))
 
+    @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        # Clear optimistic state when we get real data from coordinator
-        if self._optimistic_state is not None:
+        # Clear optimistic state when we get real data from coordinator, or
+        # signal a pending command once the device reports its state
+        if self._awaiting_state:
+            if self._reported_power_state() == self._optimistic_state:
+                self._state_reported.set()
+        elif self._optimistic_state is not None:
             self._optimistic_state = None
-        super()._handle_coordinator_update()
+        current = (self.available, self.is_on)
+        if current == self._last_written:
+            return
+        self._last_written = current
+        self.async_write_ha_state()
 
 
 class EatonXStorageEnergySavingModeSwitch(CoordinatorEntity, SwitchEntity):
     """Switch to control the Energy Saving Mode of the Eaton xStorage Home device."""
 
+    __slots__ = (
+        "_optimistic_state",
+        "_awaiting_state",
+        "_state_reported",
+        "_command_lock",
+        "_last_written",
+    )
+
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
     _attr_icon = "mdi:leaf"
+    _attr_unique_id = "eaton_xstorage_energy_saving_mode"
+    _attr_name = "Energy saving mode"
 
     def __init__(self, coordinator: EatonBatteryStorageCoordinator) -> None:
         """Initialize the energy saving mode switch."""
         super().__init__(coordinator)
-        self._attr_unique_id = "eaton_xstorage_energy_saving_mode"
-        self._attr_name = "Energy saving mode"
+        self._attr_device_info = coordinator.device_info
         self._optimistic_state: bool | None = None
-
-    @property
-    def device_info(self) -> dict[str, str]:
-        """Return device information."""
-        return self.coordinator.device_info
+        # Keep the optimistic state while refreshing after a command
+        self._awaiting_state = False
+        # Set when a refresh reports the state a command asked for
+        self._state_reported = asyncio.Event()
+        # Serializes commands so a repeated toggle waits for the first one
+        self._command_lock = asyncio.Lock()
+        # (available, is_on) as of the last state write
+        self._last_written: tuple[bool, bool | None] | None = None
 
     @property
     def is_on(self) -> bool | None:
@@ -175,172 +226,92 @@ class EatonXStorageEnergySavingModeSwitch(CoordinatorEntity, SwitchEntity):
         # If we have an optimistic state from a recent command, use that
         if self._optimistic_state is not None:
             return self._optimistic_state
+        return self._reported_energy_saving()
 
-        try:
-            # Get energy saving mode from settings data
-            settings_data = (
-                self.coordinator.data.get("settings", {})
-                if self.coordinator.data
-                else {}
-            )
-            energy_saving_mode = settings_data.get("energySavingMode", {})
-            enabled_value = energy_saving_mode.get("enabled", False)
-
-            # API returns boolean values
-            return bool(enabled_value)
-        except (AttributeError, TypeError, KeyError):
-            return False
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            self.coordinator.last_update_success and self.coordinator.data is not None
-        )
+    def _reported_energy_saving(self) -> bool:
+        """Return whether the device reports energy saving mode as enabled."""
+        # Get energy saving mode from settings data
+        data = self.coordinator.data or {}
+        settings_data = data.get("settings") or {}
+        energy_saving_mode = settings_data.get("energySavingMode") or {}
+        # API returns boolean values
+        return energy_saving_mode.get("enabled", False) is True
 
     async def async_turn_on(self, **_kwargs) -> None:
         """Turn energy saving mode on."""
-        try:
-            # Set optimistic state immediately for responsive UI
-            self._optimistic_state = True
-            self.async_write_ha_state()
-
-            # First, get the current settings from the API (not cached data)
-            current_settings_response = await self.coordinator.api.get_settings()
-            if not current_settings_response or not current_settings_response.get(
-                "result"
-            ):
-                _LOGGER.error("Failed to get current settings from API")
-                self._optimistic_state = None
-                return
-
-            # Get the current settings data
-            current_settings = current_settings_response.get("result", {})
-
-            # Transform the settings data to match PUT API expectations
-            # The GET API returns objects, but PUT API expects strings/primitives
-            if "country" in current_settings and isinstance(
-                current_settings["country"], dict
-            ):
-                current_settings["country"] = current_settings["country"].get(
-                    "geonameId", ""
-                )
-
-            if "city" in current_settings and isinstance(
-                current_settings["city"], dict
-            ):
-                current_settings["city"] = current_settings["city"].get("geonameId", "")
-
-            if "timezone" in current_settings and isinstance(
-                current_settings["timezone"], dict
-            ):
-                current_settings["timezone"] = current_settings["timezone"].get(
-                    "id", ""
-                )
-
-            # Update only the energySavingMode.enabled field
-            if "energySavingMode" not in current_settings:
-                current_settings["energySavingMode"] = {}
-            current_settings["energySavingMode"]["enabled"] = True
-
-            # API expects data wrapped in "settings" object
-            payload = {"settings": current_settings}
-
-            result = await self.coordinator.api.update_settings(payload)
-
-            if result.get("successful", result.get("result") is not None):
-                _LOGGER.info("Successfully enabled energy saving mode")
-                await asyncio.sleep(2)
-            else:
-                _LOGGER.warning(
-                    "API call completed but may not have succeeded: %s", result
-                )
-                await asyncio.sleep(1)
-
-            # Always refresh the coordinator data
-            await self.coordinator.async_request_refresh()
-
-            # Clear optimistic state so we use real data
-            self._optimistic_state = None
-
-        except Exception as exc:
-            _LOGGER.error("Error enabling energy saving mode: %s", exc)
-            # Clear optimistic state and refresh to get current state
-            self._optimistic_state = None
-            await self.coordinator.async_request_refresh()
-            raise HomeAssistantError("Failed to enable energy saving mode") from exc
+        await self._apply_energy_saving(True)
 
     async def async_turn_off(self, **_kwargs) -> None:
         """Turn energy saving mode off."""
+        await self._apply_energy_saving(False)
+
+    async def _apply_energy_saving(self, enabled: bool) -> None:
+        """Enable or disable energy saving mode on the device."""
+        # Already in the requested state, or a pending command will get there
+        if self.is_on == enabled:
+            return
+        async with self._command_lock:
+            # A command that completed while we waited may have done the work
+            if self._reported_energy_saving() == enabled:
+                return
+            await self._send_energy_saving(enabled)
+
+    async def _send_energy_saving(self, enabled: bool) -> None:
+        """Write the energy saving mode setting and refresh the device state."""
+        action, state = ("enable", "enabled") if enabled else ("disable", "disabled")
         try:
             # Set optimistic state immediately for responsive UI
-            self._optimistic_state = False
+            self._optimistic_state = enabled
             self.async_write_ha_state()
+            self._last_written = (self.available, enabled)
 
-            # First, get the current settings from the API (not cached data)
-            current_settings_response = await self.coordinator.api.get_settings()
-            if not current_settings_response or not current_settings_response.get(
-                "result"
-            ):
+            # Update only the energySavingMode.enabled field of the settings
+            # cached by the coordinator
+            overrides = {"energySavingMode": {"enabled": enabled}}
+            result = await self.coordinator.async_update_settings(overrides)
+            if result is None:
                 _LOGGER.error("Failed to get current settings from API")
-                self._optimistic_state = None
+                self._clear_optimistic_state()
                 return
 
-            # Get the current settings data
-            current_settings = current_settings_response.get("result", {})
-
-            # Transform the settings data to match PUT API expectations
-            # The GET API returns objects, but PUT API expects strings/primitives
-            if "country" in current_settings and isinstance(
-                current_settings["country"], dict
-            ):
-                current_settings["country"] = current_settings["country"].get(
-                    "geonameId", ""
-                )
-
-            if "city" in current_settings and isinstance(
-                current_settings["city"], dict
-            ):
-                current_settings["city"] = current_settings["city"].get("geonameId", "")
-
-            if "timezone" in current_settings and isinstance(
-                current_settings["timezone"], dict
-            ):
-                current_settings["timezone"] = current_settings["timezone"].get(
-                    "id", ""
-                )
-
-            # Update only the energySavingMode.enabled field
-            if "energySavingMode" not in current_settings:
-                current_settings["energySavingMode"] = {}
-            current_settings["energySavingMode"]["enabled"] = False
-
-            # API expects data wrapped in "settings" object
-            payload = {"settings": current_settings}
-
-            result = await self.coordinator.api.update_settings(payload)
-
-            if result.get("successful", result.get("result") is not None):
-                _LOGGER.info("Successfully disabled energy saving mode")
-                await asyncio.sleep(2)
+            if is_successful(result):
+                _LOGGER.info("Successfully %s energy saving mode", state)
+                # Refresh until the device reports the new state
+                await self._wait_for_energy_saving()
             else:
                 _LOGGER.warning(
                     "API call completed but may not have succeeded: %s", result
                 )
-                await asyncio.sleep(1)
-
-            # Always refresh the coordinator data
-            await self.coordinator.async_request_refresh()
-
-            # Clear optimistic state so we use real data
-            self._optimistic_state = None
+                # Clear optimistic state so we use real data
+                self._clear_optimistic_state()
+                await self.coordinator.async_request_refresh()
 
         except Exception as exc:
-            _LOGGER.error("Error disabling energy saving mode: %s", exc)
+            _LOGGER.error("Failed to %s energy saving mode: %s", action, exc)
             # Clear optimistic state and refresh to get current state
-            self._optimistic_state = None
+            self._clear_optimistic_state()
             await self.coordinator.async_request_refresh()
-            raise HomeAssistantError("Failed to disable energy saving mode") from exc
+            raise HomeAssistantError(f"Failed to {action} energy saving mode") from exc
+
+    async def _wait_for_energy_saving(self) -> None:
+        """Refresh the coordinator and wait until it reports the optimistic mode.
+
+        Clears the optimistic state afterwards so the reported state is shown
+        even if the device did not confirm the change in time.
+        """
+        self._state_reported.clear()
+        self._awaiting_state = True
+        try:
+            await _async_wait_for_report(self.coordinator, self._state_reported)
+        finally:
+            self._awaiting_state = False
+        self._clear_optimistic_state()
+
+    def _clear_optimistic_state(self) -> None:
+        """Drop the optimistic state and show the reported state."""
+        self._optimistic_state = None
+        self.async_write_ha_state()
+        self._last_written = (self.available, self.is_on)
 
     def turn_on(self, **kwargs) -> None:
         """Turn energy saving mode on (sync wrapper)."""
@@ -350,9 +321,18 @@ class EatonXStorageEnergySavingModeSwitch(CoordinatorEntity, SwitchEntity):
         """Turn energy saving mode off (sync wrapper)."""
         asyncio.create_task(self.async_turn_off(**kwargs))
 
+    @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        # Clear optimistic state when we get real data from coordinator
-        if self._optimistic_state is not None:
+        # Clear optimistic state when we get real data from coordinator, or
+        # signal a pending command once the device reports its state
+        if self._awaiting_state:
+            if self._reported_energy_saving() == self._optimistic_state:
+                self._state_reported.set()
+        elif self._optimistic_state is not None:
             self._optimistic_state = None
-        super()._handle_coordinator_update()
+        current = (self.available, self.is_on)
+        if current == self._last_written:
+            return
+        self._last_written = current
+        self.async_write_ha_state()